@@ -1,38 +1,71 @@
-import sys, json, shutil, re, calendar
+import sys, json, shutil, re, calendar, threading, functools, importlib.util
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import requests
 import os
-from tinytag import TinyTag
 from PySide6.QtWidgets import (QApplication, QWidget, QLabel, QPushButton,
-    QTextEdit, QVBoxLayout, QHBoxLayout, QComboBox, QSlider, QFileDialog, QMessageBox, QLineEdit, QProgressDialog)
-from PySide6.QtCore import Qt, QTimer, QUrl, QPoint, QLoggingCategory, QRect
-from PySide6.QtGui import QPixmap, QImage, QFont, QColor, QTextCursor, QPainter, QPen
+    QTextEdit, QVBoxLayout, QHBoxLayout, QComboBox, QSlider, QFileDialog, QMessageBox, QLineEdit, QProgressDialog, QToolTip)
+from PySide6.QtCore import Qt, QTimer, QUrl, QPoint, QLoggingCategory, QRect, QSize, QObject, Signal, QSignalBlocker
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QTransform, QFont, QColor, QTextCursor, QPainter, QPen
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PIL import Image, ExifTags, ImageOps
-try:
-    from hachoir.parser import createParser
-    from hachoir.metadata import extractMetadata
-    HACHOIR_AVAILABLE = True
-except ImportError:
-    HACHOIR_AVAILABLE = False
-try:
-    from pymediainfo import MediaInfo
-    MEDIAINFO_AVAILABLE = True
-except ImportError:
-    MEDIAINFO_AVAILABLE = False
+# Video metadata libraries are only imported when a video is first read, keeping them off the startup path
+HACHOIR_AVAILABLE = importlib.util.find_spec("hachoir") is not None
+MEDIAINFO_AVAILABLE = importlib.util.find_spec("pymediainfo") is not None
 
-SUPPORTED_IMAGES = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp"}
-SUPPORTED_VIDEOS = {".mp4", ".mov", ".avi", ".mkv", ".flv", ".wmv", ".webm", ".m4v", ".3gp"}
+SUPPORTED_IMAGES = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp"})
+SUPPORTED_VIDEOS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".flv", ".wmv", ".webm", ".m4v", ".3gp"})
+SUPPORTED_MEDIA = SUPPORTED_IMAGES | SUPPORTED_VIDEOS
 JSON_NAME = "annotations.json"
+METADATA_CACHE_NAME = "metadata_cache.json"  # Metadata read from media files, stored next to JSON_NAME
+GEOCODE_CACHE_NAME = "geocode_cache.json"  # Reverse-geocoded addresses, stored next to JSON_NAME
 PVA_DATA_DIR = "pva_data"  # Directory to store annotations and backups
 TRASH_DIR = "discarded"  # Use "set_aside" if it exists for backward compatibility
 DEFAULT_FONT_SIZE = 14
 DEFAULT_IMAGE_TIME = 5  # seconds per image
+SAVE_DELAY_MS = 1000  # Changes are written once edits and navigation pause this long
+METADATA_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Metadata reads wait on disk, so use more threads than cores
+# MediaInfo date fields tried in order for a video's creation time (after the timezone-aware QuickTime date)
+VIDEO_DATE_FIELDS = ('com.apple.quicktime.creationdate', 'creation_time', 'creation_time-eng',
+                     'date_time_original', 'datetimeoriginal', 'encoded_date', 'encoded_date-eng',
+                     'tagged_date', 'tagged_date-eng', 'recorded_date', 'recorded_date-eng',
+                     'other_creation_date', 'other_recorded_date', 'other_encoded_date', 'other_tagged_date')
+MEDIAINFO_ISO6709_KEY = "comapplequicktimelocationiso6709"  # com.apple.quicktime.location.ISO6709 as pymediainfo names it
+MEDIAINFO_PARSE_SPEED = 0.0  # libmediainfo ParseSpeed: 0 = headers only, pymediainfo's default 0.5 also scans the streams
+# Decoded display images kept for quick Next/Prev and flipping back to recent files; each is at most
+# 800x600 after scaling (under 2 MB), so the count also bounds memory
+IMAGE_CACHE_SIZE = 32
+VOLUME_LEVELS = (100, 80, 60, 40, 20, 0)  # Volume button cycle, in percent
+NEXT_VOLUME_LEVEL = {v: VOLUME_LEVELS[(i + 1) % len(VOLUME_LEVELS)] for i, v in enumerate(VOLUME_LEVELS)}
 DATETIME_FMT = "%Y/%m/%d %H:%M:%S"
 LEGACY_DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+NON_NUMERIC_RE = re.compile(r"[^0-9.]")  # Everything except ASCII digits and the decimal point
+FILENAME_DATETIME_RE = re.compile(r"(20\d{2})(\d{2})(\d{2})[_-]?(\d{2})(\d{2})(\d{2})")  # e.g. PXL_20230322_131809
+FILENAME_DATE_RE = re.compile(r"(20\d{2})(\d{2})(\d{2})")
+# EXIF tag IDs, fixed by the EXIF standard
+EXIF_ORIENTATION_TAG = 274  # 0x0112, in IFD0
+EXIF_IFD_TAG = 34665  # 0x8769, pointer to the Exif sub-IFD
+EXIF_GPSINFO_TAG = 34853  # 0x8825, pointer to the GPS IFD
+EXIF_DATETIME_ORIGINAL_TAG = 36867  # 0x9003, in the Exif sub-IFD
+# Leading bytes of the image formats that can carry EXIF (JPEG, TIFF, PNG); WebP and HEIC are checked separately
+EXIF_CAPABLE_MAGIC = (b"\xff\xd8\xff", b"II*\x00", b"MM\x00*", b"\x89PNG")
+# Map EXIF orientation to rotation in degrees
+# Note: Values 2,4,5,7 involve flips; those are handled by ImageOps.exif_transpose
+ORIENTATION_TO_DEGREES = {
+    1: 0,      # Normal
+    2: 0,      # Flip horizontal (handled by exif_transpose)
+    3: 180,    # Rotate 180°
+    4: 0,      # Flip vertical (handled by exif_transpose)
+    5: 90,     # Flip + rotate 90° CCW (handled by exif_transpose)
+    6: 270,    # Rotate 90° CW
+    7: 270,    # Flip + rotate 90° CW (handled by exif_transpose)
+    8: 90      # Rotate 90° CCW
+}
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -43,11 +76,35 @@ def resource_path(relative_path):
         base_path = Path(__file__).parent
     return base_path / relative_path
 
+def write_text_atomic(path, text):
+    """Write text to path through a temporary file and os.replace, so a crash never leaves it half-written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+def write_annotation_files(json_path, backup_path, text):
+    """Write serialized annotations to the main file and the dated backup (runs on the save worker)."""
+    write_text_atomic(json_path, text)
+    backup_path.write_text(text)
+
 def format_creation_timestamp(ts):
     """Format Unix timestamp to display/save format."""
     local_dt = datetime.fromtimestamp(ts)
     return local_dt.strftime(DATETIME_FMT)
 
+def parse_fixed_datetime(s):
+    """Parse fixed-width "YYYY/MM/DD HH:MM:SS" or "YYYY-MM-DD HH:MM:SS" into a naive datetime
+    by slicing, without strptime. Returns None for any other shape so callers can fall back."""
+    if len(s) != 19 or s[4] not in "-/" or s[7] != s[4] or s[10] != " " or s[13] != ":" or s[16] != ":":
+        return None
+    digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]))
+    except ValueError:
+        return None
+
 def parse_creation_value(value):
     """Parse stored creation time value (string or number) into Unix timestamp."""
     if value is None:
@@ -56,22 +113,31 @@ def parse_creation_value(value):
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        for fmt in (DATETIME_FMT, LEGACY_DATETIME_FMT):
-            try:
-                return datetime.strptime(value.strip(), fmt).timestamp()
-            except ValueError:
-                continue
-        # Last resort: try ISO
-        try:
-            return datetime.fromisoformat(value.strip()).timestamp()
-        except Exception:
-            pass
-        # Or numeric string
+        return parse_creation_string(value)
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def parse_creation_string(value):
+    """String case of parse_creation_value. Cached because files from the same burst or
+    import share timestamp strings, and a repeated string then skips every parse attempt."""
+    dt_obj = parse_fixed_datetime(value.strip())
+    if dt_obj is not None:
+        return dt_obj.timestamp()
+    for fmt in (DATETIME_FMT, LEGACY_DATETIME_FMT):
         try:
-            return float(value)
+            return datetime.strptime(value.strip(), fmt).timestamp()
         except ValueError:
-            return None
-    return None
+            continue
+    # Last resort: try ISO
+    try:
+        return datetime.fromisoformat(value.strip()).timestamp()
+    except Exception:
+        pass
+    # Or numeric string
+    try:
+        return float(value)
+    except ValueError:
+        return None
 
 def parse_datetime_string(dt_str):
     """Parse various datetime string forms into timestamp. Returns None if unparsed.
@@ -81,8 +147,11 @@ def parse_datetime_string(dt_str):
         return None
     if isinstance(dt_str, (list, tuple)) and dt_str:
         dt_str = dt_str[0]
-    s = str(dt_str).strip()
+    return parse_datetime_text(str(dt_str).strip())
 
+@functools.lru_cache(maxsize=4096)
+def parse_datetime_text(s):
+    """Stripped-string case of parse_datetime_string, cached like parse_creation_string."""
     # Detect if this is a UTC timestamp (before we strip the indicators)
     is_utc = False
     original_s = s
@@ -96,26 +165,39 @@ def parse_datetime_string(dt_str):
         is_utc = True
         s = s[4:]
 
-    # Try ISO first
-    try:
-        dt_obj = datetime.fromisoformat(s)
-        # If timezone-aware, .timestamp() handles conversion correctly
-        # If naive and is_utc=True, use calendar.timegm to treat as UTC
-        if dt_obj.tzinfo is not None:
-            # Timezone-aware datetime
-            return dt_obj.timestamp()
-        elif is_utc:
-            # Naive datetime but marked as UTC
-            result = calendar.timegm(dt_obj.timetuple())
-            return result
-        else:
-            # Naive datetime, assume local
-            return dt_obj.timestamp()
-    except Exception:
-        pass
+    # Fixed-width "YYYY/MM/DD HH:MM:SS" / "YYYY-MM-DD HH:MM:SS" is the common case
+    dt_obj = parse_fixed_datetime(s)
+    if dt_obj is not None:
+        if is_utc:
+            return calendar.timegm(dt_obj.timetuple())
+        return dt_obj.timestamp()
+
+    # Every format below starts with a 4-digit year, so skip the raise-and-catch attempts otherwise
+    if len(s) < 8 or not s[:4].isdigit():
+        return None
+    slash_date = s[4] == '/'
+
+    # Try ISO first (ISO 8601 never separates the date with '/')
+    if not slash_date:
+        try:
+            dt_obj = datetime.fromisoformat(s)
+            # If timezone-aware, .timestamp() handles conversion correctly
+            # If naive and is_utc=True, use calendar.timegm to treat as UTC
+            if dt_obj.tzinfo is not None:
+                # Timezone-aware datetime
+                return dt_obj.timestamp()
+            elif is_utc:
+                # Naive datetime but marked as UTC
+                result = calendar.timegm(dt_obj.timetuple())
+                return result
+            else:
+                # Naive datetime, assume local
+                return dt_obj.timestamp()
+        except Exception:
+            pass
 
-    # Try common fallback formats
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y/%m/%d %H:%M:%S"):
+    # Try common fallback formats, only those with the matching date separator
+    for fmt in (("%Y/%m/%d %H:%M:%S",) if slash_date else ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")):
         try:
             dt_obj = datetime.strptime(s, fmt)
             # If UTC was detected, interpret naive datetime as UTC time
@@ -133,9 +215,13 @@ def parse_datetime_string(dt_str):
 
 def parse_filename_datetime(path):
     """Try to infer datetime from filename patterns like PXL_YYYYMMDD_HHMMSS.*"""
-    name = path.name
+    return parse_filename_text(path.name)
+
+@functools.lru_cache(maxsize=4096)
+def parse_filename_text(name):
+    """Epoch for a date (and time) embedded in a filename, or None; cached since scans and sorts revisit names."""
     # Pattern with date and time
-    m = re.search(r"(20\d{2})(\d{2})(\d{2})[_-]?(\d{2})(\d{2})(\d{2})", name)
+    m = FILENAME_DATETIME_RE.search(name)
     if m:
         y, mo, d, h, mi, s = m.groups()
         try:
@@ -143,7 +229,7 @@ def parse_filename_datetime(path):
         except ValueError:
             pass
     # Pattern with date only
-    m = re.search(r"(20\d{2})(\d{2})(\d{2})", name)
+    m = FILENAME_DATE_RE.search(name)
     if m:
         y, mo, d = m.groups()
         try:
@@ -152,19 +238,56 @@ def parse_filename_datetime(path):
             pass
     return None
 
-def get_exif_datetime(path):
+@functools.lru_cache(maxsize=128)
+def read_exif_tags(path_str, mtime_ns):
+    """Read an image's EXIF tags once per (path, mtime) and return {tag_id: value} or None.
+    Image.open only parses the file header, so no pixel data is decoded.
+    Only the tags used here are decoded; getexif() skips MakerNote and other large blocks."""
+    # Check the magic bytes first so formats without EXIF (GIF, BMP) never go through PIL
+    with open(path_str, "rb") as f:
+        head = f.read(12)
+        if not (head.startswith(EXIF_CAPABLE_MAGIC) or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+                or head[4:8] == b"ftyp"):
+            return None
+        # Hand PIL the already-open file rather than opening the path a second time
+        f.seek(0)
+        with Image.open(f) as img:
+            exif = img.getexif()
+            if not exif:
+                return None
+            tags = {}
+            if EXIF_ORIENTATION_TAG in exif:
+                tags[EXIF_ORIENTATION_TAG] = exif[EXIF_ORIENTATION_TAG]
+            date_original = exif.get_ifd(EXIF_IFD_TAG).get(EXIF_DATETIME_ORIGINAL_TAG)
+            if date_original:
+                tags[EXIF_DATETIME_ORIGINAL_TAG] = date_original
+            # The GPS IFD is stored as {gps_tag_id: value}
+            gps_ifd = exif.get_ifd(EXIF_GPSINFO_TAG)
+            if gps_ifd:
+                tags[EXIF_GPSINFO_TAG] = dict(gps_ifd)
+            return tags or None
+
+def get_exif_tags(path, st=None):
+    """Return the EXIF tag dict shared by the get_exif_* helpers (do not modify), or None.
+    st is the file's stat result if the caller already has it."""
+    try:
+        return read_exif_tags(str(path), (st or path.stat()).st_mtime_ns)
+    except Exception:
+        return None
+
+def get_exif_datetime(path, st=None, suffix=None):
     """Extract DateTimeOriginal from EXIF data as a string (naive local time).
     Returns the string directly without any timezone conversion.
-    Format: "YYYY/MM/DD HH:MM:SS" or 0 if not found."""
+    Format: "YYYY/MM/DD HH:MM:SS" or 0 if not found.
+    suffix is the lowercased file suffix if the caller already computed it."""
     try:
-        if path.suffix.lower() not in SUPPORTED_IMAGES:
+        if (suffix or path.suffix.lower()) not in SUPPORTED_IMAGES:
             return 0
-        img = Image.open(path)
-        exif = img._getexif()
+        exif = get_exif_tags(path, st)
         if not exif:
             return 0
-        # Look for DateTimeOriginal (tag 36867) - the actual photo taken date
-        datetime_original = exif.get(36867)
+        # DateTimeOriginal is the actual photo taken date
+        datetime_original = exif.get(EXIF_DATETIME_ORIGINAL_TAG)
         if datetime_original:
             # EXIF datetime format: "YYYY:MM:DD HH:MM:SS"
             # Convert to our display format, preserving the literal time
@@ -173,7 +296,27 @@ def get_exif_datetime(path):
         pass
     return 0
 
-def get_video_creation_time(path):
+@functools.lru_cache(maxsize=512)
+def read_mediainfo_tracks(path_str, mtime_ns):
+    """Parse a file with MediaInfo once per (path, mtime) and return its tracks as data dicts.
+    mtime_ns is only part of the cache key, so a rewritten file is parsed again."""
+    from pymediainfo import MediaInfo
+    # parse_speed=0 reads only the container headers, which hold every field we use (dates, GPS, duration),
+    # instead of also sampling stream data
+    mi = MediaInfo.parse(path_str, parse_speed=MEDIAINFO_PARSE_SPEED)
+    return tuple(track.to_data() for track in mi.tracks) if mi else ()
+
+def get_mediainfo_tracks(path, st=None):
+    """Return MediaInfo track data dicts for path (shared, do not modify), or () if unavailable.
+    st is the file's stat result if the caller already has it."""
+    if not MEDIAINFO_AVAILABLE:
+        return ()
+    try:
+        return read_mediainfo_tracks(str(path), (st or path.stat()).st_mtime_ns)
+    except Exception:
+        return ()
+
+def get_video_creation_time(path, st=None):
     """Extract creation time for videos using MediaInfo (QuickTime/MP4 metadata).
     Extracts timezone-aware creation date when available (all video formats).
     Returns tuple (epoch, display_string, has_timezone, tz_label) where:
@@ -184,12 +327,7 @@ def get_video_creation_time(path):
     """
     if not MEDIAINFO_AVAILABLE:
         return (0, "", False, None)
-    try:
-        mi = MediaInfo.parse(path)
-    except Exception:
-        mi = None
-
-    candidates = []  # list of tuples (source, raw_value, parsed_ts)
+    tracks = get_mediainfo_tracks(path, st)
 
     def format_offset(tzinfo_obj):
         """Return +HH:MM or -HH:MM from tzinfo.utcoffset()."""
@@ -205,77 +343,18 @@ def get_video_creation_time(path):
         except Exception:
             return None
 
-    def add_candidate(label, raw):
-        ts = parse_datetime_string(raw)
-        candidates.append((label, raw, ts))
-        return ts
-
-    def candidate_times(track):
-        data = track.to_data() if hasattr(track, 'to_data') else {}
-
-        def add_field(key, label=None):
-            val = data.get(key)
-            if val:
-                add_candidate(label or key, val)
-
-        # QuickTime specific - check for the creation date with timezone info FIRST
+    # Try MediaInfo fields in priority order and stop at the first one that parses
+    for data in tracks:
+        if data.get("track_type") not in ("General", "Video"):
+            continue
+        # QuickTime creation date with timezone info comes first
         # Example: "2025-11-28T09:12:31+0700" (already has timezone!)
         # This works for both .mov and .mp4 files with QuickTime metadata
         qt_date = data.get('comapplequicktimecreationdate')
-        if qt_date:
-            # Add with special marker so we handle it separately with timezone awareness
-            candidates.append(('comapplequicktimecreationdate', qt_date, None))
-
-        add_field('com.apple.quicktime.creationdate', 'qt_creationdate')
-
-        # Generic creation_time
-        add_field('creation_time', 'creation_time')
-        add_field('creation_time-eng', 'creation_time-eng')
-        # EXIF-like
-        add_field('date_time_original', 'date_time_original')
-        add_field('datetimeoriginal', 'datetimeoriginal')
-        # Other common date fields
-        add_field('encoded_date', 'encoded_date'); add_field('encoded_date-eng', 'encoded_date-eng')
-        add_field('tagged_date', 'tagged_date'); add_field('tagged_date-eng', 'tagged_date-eng')
-        add_field('recorded_date', 'recorded_date'); add_field('recorded_date-eng', 'recorded_date-eng')
-        # MediaInfo provided lists
-        for attr in ["other_creation_date", "other_recorded_date", "other_encoded_date", "other_tagged_date"]:
-            val = getattr(track, attr, None)
-            if val:
-                add_candidate(attr, val)
-
-    # Collect from MediaInfo
-    if mi and mi.tracks:
-        for track in mi.tracks:
-            if track.track_type not in ("General", "Video"):
-                continue
-            candidate_times(track)
-
-    # Filename-derived candidate
-    filename_ts = parse_filename_datetime(path)
-    candidates.append(("filename", path.name, filename_ts))
-
-    # Filesystem timestamps as last resort
-    try:
-        st = path.stat()
-        fs_candidates = [
-            ("fs_birthtime", getattr(st, 'st_birthtime', None)),
-            ("fs_mtime", st.st_mtime),
-            ("fs_ctime", st.st_ctime),
-        ]
-        for lbl, raw in fs_candidates:
-            candidates.append((lbl, raw, raw if raw else None))
-    except Exception:
-        pass
-
-    # Choose first parsed in order we collected
-    for source, raw, ts in candidates:
-        # Special handling for timezone-aware dates (both MOV and MP4)
-        if source == 'comapplequicktimecreationdate' and isinstance(raw, str):
+        if isinstance(qt_date, str):
             try:
-                # Format: "2025-11-28T09:12:31+0700" - ISO 8601 with timezone offset
                 # datetime.fromisoformat() handles the +0700 timezone correctly
-                dt_aware = datetime.fromisoformat(str(raw))
+                dt_aware = datetime.fromisoformat(qt_date)
                 # Extract the local/wall-clock time (what the camera showed)
                 local_time = dt_aware.replace(tzinfo=None)
                 display = local_time.strftime("%Y/%m/%d %H:%M:%S")
@@ -285,16 +364,56 @@ def get_video_creation_time(path):
                 return (correct_epoch, display, True, tz_label)  # True = timezone was found
             except Exception:
                 pass
+        for key in VIDEO_DATE_FIELDS:
+            ts = parse_datetime_string(data.get(key))
+            if ts:
+                display = datetime.fromtimestamp(ts).strftime("%Y/%m/%d %H:%M:%S")
+                return (ts, display, False, None)  # False = no timezone info
+
+    # Filename-derived time
+    ts = parse_filename_datetime(path)
+
+    # Filesystem timestamps as last resort
+    if not ts:
+        try:
+            st = st or path.stat()
+            ts = getattr(st, 'st_birthtime', None) or st.st_mtime or st.st_ctime
+        except Exception:
+            pass
 
-        # Standard path for other timestamps (no timezone info)
-        if ts:
-            display = datetime.fromtimestamp(ts).strftime("%Y/%m/%d %H:%M:%S")
-            return (ts, display, False, None)  # False = no timezone info
+    if ts:
+        display = datetime.fromtimestamp(ts).strftime("%Y/%m/%d %H:%M:%S")
+        return (ts, display, False, None)
 
     # No valid creation time found
     return (0, "", False, None)
 
-def get_file_creation_time(path):
+def exif_creation_time(path, st, suffix):
+    """Creation time from EXIF DateTimeOriginal (naive local time, assume camera's local timezone), or None."""
+    exif_str = get_exif_datetime(path, st, suffix)
+    if exif_str and exif_str != 0:
+        # Parse it to get an epoch for sorting (treating string as naive/local)
+        dt_obj = parse_fixed_datetime(exif_str) or datetime.strptime(exif_str, DATETIME_FMT)
+        sort_epoch = dt_obj.timestamp()
+        return (sort_epoch, exif_str, False, None)  # EXIF has no tz info, needs inference
+    return None
+
+def mediainfo_creation_time(path, st, suffix):
+    """Creation time from MediaInfo metadata with timezone extraction, or None."""
+    video_result = get_video_creation_time(path, st)
+
+    # get_video_creation_time returns (epoch, display_string, has_timezone, tz_label)
+    if isinstance(video_result, tuple) and len(video_result) == 4:
+        video_epoch, display, has_tz, tz_label = video_result
+        if video_epoch > 0:  # Valid result found
+            return (video_epoch, display, has_tz, tz_label)
+    return None
+
+# Metadata reader for each supported suffix; other files go straight to filesystem times
+CREATION_TIME_READERS = {**{suffix: exif_creation_time for suffix in SUPPORTED_IMAGES},
+                         **{suffix: mediainfo_creation_time for suffix in SUPPORTED_VIDEOS}}
+
+def get_file_creation_time(path, st=None, suffix=None):
     """Get file creation time with proper timezone handling.
     For images: EXIF is naive local time (extracted as wall-clock)
     For videos: MediaInfo contains timezone-aware QuickTime dates (extract wall-clock from tz)
@@ -304,31 +423,19 @@ def get_file_creation_time(path):
       - display_string: Wall-clock time (camera's local time)
       - has_timezone: True if timezone info was found, False if using fallback
       - tz_label: human-readable tz offset like "+07:00" when known, else None
+    st is the file's stat result if the caller already has it, so the file is only stat'ed once;
+    suffix is the lowercased file suffix if the caller already computed it.
     """
     try:
-        suffix = path.suffix.lower()
-
-        # For images: get EXIF datetime (naive local time, assume camera's local timezone)
-        if suffix in SUPPORTED_IMAGES:
-            exif_str = get_exif_datetime(path)
-            if exif_str and exif_str != 0:
-                # Parse it to get an epoch for sorting (treating string as naive/local)
-                dt_obj = datetime.strptime(exif_str, DATETIME_FMT)
-                sort_epoch = dt_obj.timestamp()
-                return (sort_epoch, exif_str, False, None)  # EXIF has no tz info, needs inference
-
-        # For videos: get MediaInfo metadata with timezone extraction
-        if suffix in SUPPORTED_VIDEOS:
-            video_result = get_video_creation_time(path)
-
-            # get_video_creation_time returns (epoch, display_string, has_timezone)
-            if isinstance(video_result, tuple) and len(video_result) == 4:
-                video_epoch, display, has_tz, tz_label = video_result
-                if video_epoch > 0:  # Valid result found
-                    return (video_epoch, display, has_tz, tz_label)
+        suffix = suffix or path.suffix.lower()
+        reader = CREATION_TIME_READERS.get(suffix)
+        if reader is not None:
+            result = reader(path, st, suffix)
+            if result is not None:
+                return result
 
         # Fall back to filesystem timestamps (these are stored in UTC)
-        stat = path.stat()
+        stat = st or path.stat()
         times = []
 
         # Collect all available timestamps
@@ -345,47 +452,160 @@ def get_file_creation_time(path):
     except:
         return (0, "", False, None)
 
+class JsonCache:
+    """Dict of cache entries persisted to a JSON file; in-memory only until open() is called.
+    Safe to use from worker threads."""
+    def __init__(self):
+        self.json_path = None
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def open(self, json_path):
+        """Switch to the given cache file, loading it if it exists."""
+        entries = {}
+        if json_path.exists():
+            try:
+                entries = json.loads(json_path.read_bytes())
+            except (OSError, ValueError):
+                entries = {}
+        with self.lock:
+            self.json_path = json_path
+            self.entries = entries
+            self.dirty = False
+
+    def save(self):
+        """Write the cache to disk if anything was added since the last save."""
+        with self.lock:
+            if not self.dirty or self.json_path is None:
+                return
+            text = json.dumps(self.entries)
+            self.dirty = False
+        self.json_path.write_text(text)
+
+class MetadataCache(JsonCache):
+    """Persistent cache of values read from media files (creation time, GPS, duration).
+    Entries are keyed by path relative to the album and dropped when the file's mtime or size changes."""
+    def __init__(self):
+        super().__init__()
+        self.root = None
+
+    def open(self, root, json_path):
+        """Switch to the cache file for the album at root, loading it if it exists."""
+        super().open(json_path)
+        self.root = root
+
+    def get(self, path, field, compute, st=None):
+        """Return the cached field for path, calling compute(path) and storing the result on a miss.
+        st is the file's stat result if the caller already has it."""
+        try:
+            st = st or path.stat()
+        except OSError:
+            return compute(path)
+        try:
+            key = path.relative_to(self.root).as_posix() if self.root else str(path)
+        except ValueError:
+            key = str(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.get("stamp") == stamp and field in entry:
+                return entry[field]
+        value = compute(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.get("stamp") != stamp:
+                entry = self.entries[key] = {"stamp": stamp}
+            entry[field] = value
+            self.dirty = True
+        return value
+
+class GeocodeCache(JsonCache):
+    """Persistent cache of reverse-geocoded addresses keyed by (lat, lon) rounded to 3 decimals (~100 m)."""
+    def __init__(self):
+        super().__init__()
+        self.failed = set()  # Keys whose lookup failed this session; not saved, so they are retried next run
+
+    def get(self, lat, lon, compute):
+        """Return the cached address near (lat, lon), calling compute(lat, lon) on a miss.
+        Failed lookups (None) are only remembered for this session."""
+        key = f"{lat:.3f},{lon:.3f}"
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]
+            if key in self.failed:
+                return None
+        value = compute(lat, lon)
+        with self.lock:
+            if value is not None:
+                self.entries[key] = value
+                self.dirty = True
+            else:
+                self.failed.add(key)
+        return value
+
+# In-memory until load_directory points them at the album's pva_data directory
+metadata_cache = MetadataCache()
+geocode_cache = GeocodeCache()
+
+def scan_media_dir(dir_path):
+    """List dir_path once with os.scandir.
+    Returns (media, subdirs): (Path, DirEntry, lowercase suffix) triples for supported media files,
+    and DirEntry objects for subfolders.
+    DirEntry answers is_file/is_dir from the directory listing and caches its stat() result."""
+    media = []
+    subdirs = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_file():
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in SUPPORTED_MEDIA:
+                    media.append((Path(entry.path), entry, suffix))
+            elif entry.is_dir():
+                subdirs.append(entry)
+    return media, subdirs
+
+def get_cached_file_creation_time(path, dir_entry=None, suffix=None):
+    """get_file_creation_time through the metadata cache (JSON turns the tuple into a list).
+    The file is stat'ed once (or its scandir DirEntry's stat reused) and the result shared
+    by the cache check and every metadata reader."""
+    try:
+        st = dir_entry.stat() if dir_entry is not None else path.stat()
+    except OSError:
+        st = None
+    return tuple(metadata_cache.get(path, "creation", lambda p: get_file_creation_time(p, st, suffix), st))
+
+def scan_creation_times(paths, dir_entries=None, suffixes=None):
+    """Run get_cached_file_creation_time over many files on a thread pool, returning results in input order.
+    dir_entries optionally gives the matching scandir DirEntry (or None) for each path,
+    and suffixes the lowercased suffix (or None) for each path.
+    PIL and MediaInfo spend their time in file I/O and C code, so threads overlap well."""
+    if dir_entries is None:
+        dir_entries = [None] * len(paths)
+    if suffixes is None:
+        suffixes = [None] * len(paths)
+    if len(paths) < 2:
+        return [get_cached_file_creation_time(p, e, x) for p, e, x in zip(paths, dir_entries, suffixes)]
+    with ThreadPoolExecutor(max_workers=min(METADATA_SCAN_WORKERS, len(paths))) as pool:
+        return list(pool.map(get_cached_file_creation_time, paths, dir_entries, suffixes))
 
 def get_exif_rotation(path):
     """Get EXIF rotation in degrees. Handles all EXIF orientation values."""
     try:
-        img = Image.open(path)
-        exif = img._getexif()
+        exif = get_exif_tags(path)
         if not exif: return 0
-        for k, v in ExifTags.TAGS.items():
-            if v == "Orientation":
-                orientation = exif.get(k, 1)
-                # Map EXIF orientation to rotation in degrees
-                # Note: Values 2,4,5,7 involve flips; those are now handled by ImageOps.exif_transpose
-                # This function returns the "base" rotation for display purposes
-                orientation_to_degrees = {
-                    1: 0,      # Normal
-                    2: 0,      # Flip horizontal (handled by exif_transpose)
-                    3: 180,    # Rotate 180°
-                    4: 0,      # Flip vertical (handled by exif_transpose)
-                    5: 90,     # Flip + rotate 90° CCW (handled by exif_transpose)
-                    6: 270,    # Rotate 90° CW
-                    7: 270,    # Flip + rotate 90° CW (handled by exif_transpose)
-                    8: 90      # Rotate 90° CCW
-                }
-                return orientation_to_degrees.get(orientation, 0)
+        # This function returns the "base" rotation for display purposes
+        return ORIENTATION_TO_DEGREES.get(exif.get(EXIF_ORIENTATION_TAG, 1), 0)
     except:
         return 0
-    return 0
 
 def get_exif_gps(path):
     """Extract latitude and longitude from EXIF data. Returns (lat, lon) or None."""
     try:
-        img = Image.open(path)
-        exif = img._getexif()
+        exif = get_exif_tags(path)
         if not exif: return None
 
-        gps_ifd = None
-        for tag, value in exif.items():
-            if ExifTags.TAGS.get(tag) == "GPSInfo":
-                gps_ifd = value
-                break
-
+        gps_ifd = exif.get(EXIF_GPSINFO_TAG)
         if not gps_ifd: return None
 
         gps_data = {}
@@ -408,105 +628,128 @@ def get_exif_gps(path):
         return (lat, lon) if lat and lon else None
     except: return None
 
+def find_sign(s, start):
+    """Index of the first '+' or '-' in s at or after start, or len(s) if there is none."""
+    plus = s.find('+', start)
+    minus = s.find('-', start)
+    if plus < 0:
+        return minus if minus >= 0 else len(s)
+    return plus if minus < 0 else min(plus, minus)
+
 def parse_iso6709(iso_str):
-    """Parse ISO 6709 format: +DD.DDDD+DDD.DDDD[+DDD.DDD]/
-    Returns (lat, lon) or None."""
+    """Parse ISO 6709 format: +DD.DDDD+DDD.DDDD[+DDD.DDD][CRS...]/
+    Returns (lat, lon) or None.
+
+    >>> parse_iso6709("+40.20361-075.00417CRSWGS_84/")
+    (40.20361, -75.00417)
+    """
     if not iso_str:
         return None
+    # Remove trailing /
+    iso_str = str(iso_str).rstrip('/')
+    # Pattern: +/-latitude +/-longitude [+/-altitude] [CRS suffix]
+    # Latitude ends where the longitude's sign starts; longitude ends at the first character that is
+    # not a digit or '.', which is the altitude's sign or a CRS suffix like "CRSWGS_84"
+    lon_start = find_sign(iso_str, 1)
+    if lon_start >= len(iso_str):
+        return None
+    lon_end = lon_start + 1
+    while lon_end < len(iso_str) and iso_str[lon_end] in "0123456789.":
+        lon_end += 1
     try:
-        # Remove trailing /
-        iso_str = str(iso_str).rstrip('/')
-        # Pattern: +/-latitude +/-longitude [+/-altitude]
-        # Use regex to extract the three parts
-        m = re.match(r'([+-]?\d+\.?\d*)([+-]\d+\.?\d*)([+-]?\d+\.?\d*)?', iso_str)
-        if m:
-            lat = float(m.group(1))
-            lon = float(m.group(2))
-            return (lat, lon)
-    except:
-        pass
-    return None
+        return (float(iso_str[:lon_start]), float(iso_str[lon_start:lon_end]))
+    except ValueError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def mediainfo_gps_fields(key):
+    """Return (is_iso6709, is_latitude, is_longitude) for a MediaInfo field name.
+    Files share the same few hundred field names, so each name is lowercased and searched only once."""
+    key_lower = key.lower()
+    return ('iso6709' in key_lower, 'lat' in key_lower, 'lon' in key_lower)
+
+def iter_hachoir_groups(metadata):
+    """Yield hachoir metadata and, for MultipleMetadata, each sub-group in turn, in exportPlaintext() order.
+    has()/get() only look at the group they are called on."""
+    yield metadata
+    if hasattr(metadata, 'iterGroups'):
+        for group in metadata.iterGroups():
+            yield from iter_hachoir_groups(group)
 
 def get_video_gps(path):
-    """Extract GPS coordinates from video metadata using hachoir and MediaInfo."""
+    """Extract GPS coordinates from video metadata using MediaInfo, then hachoir."""
     gps_candidates = []  # list of (source, lat, lon, raw_values)
 
-    # Try hachoir first
-    if HACHOIR_AVAILABLE:
+    # Try MediaInfo first: it is native and phone videos carry GPS in its ISO 6709 tag
+    if MEDIAINFO_AVAILABLE:
         try:
-            parser = createParser(str(path))
-            if parser:
-                metadata = extractMetadata(parser)
-                if metadata:
-                    lat = None
-                    lon = None
-                    hachoir_data = []
-                    for line in metadata.exportPlaintext():
-                        line_lower = line.lower()
-                        hachoir_data.append(line)
-                        if 'latitude' in line_lower and ':' in line:
+            tracks = get_mediainfo_tracks(path)
+            # Phone videos store the location under one known key; read it directly before scanning every field
+            for data in tracks:
+                iso_coords = parse_iso6709(data.get(MEDIAINFO_ISO6709_KEY))
+                if iso_coords and iso_coords[0] and iso_coords[1]:
+                    return iso_coords
+            if tracks:
+                lat = None
+                lon = None
+                for data in tracks:
+                    for key, val in data.items():
+                        if not val:
+                            continue
+                        # Look for GPS fields
+                        is_iso6709, is_lat, is_lon = mediainfo_gps_fields(key)
+                        # Check for ISO 6709 format (com.apple.quicktime.locationiso6709)
+                        if is_iso6709:
+                            iso_coords = parse_iso6709(val)
+                            if iso_coords:
+                                lat, lon = iso_coords
+                        if is_lat:
                             try:
-                                parts = line.split(':', 1)
-                                if len(parts) == 2:
-                                    lat_str = parts[1].strip().replace('+', '')
-                                    lat = float(lat_str)
+                                if isinstance(val, (list, tuple)):
+                                    lat = float(val[0])
+                                else:
+                                    lat = float(val)
                             except:
                                 pass
-                        if 'longitude' in line_lower and ':' in line:
+                        if is_lon:
                             try:
-                                parts = line.split(':', 1)
-                                if len(parts) == 2:
-                                    lon_str = parts[1].strip().replace('+', '')
-                                    lon = float(lon_str)
+                                if isinstance(val, (list, tuple)):
+                                    lon = float(val[0])
+                                else:
+                                    lon = float(val)
                             except:
                                 pass
-                    if lat or lon:\
-                        gps_candidates.append(('hachoir', lat, lon, hachoir_data))
-                    else:
-                        gps_candidates.append(('hachoir', None, None, hachoir_data))
-                parser.stream._input.close()
+                if lat and lon:
+                    return (lat, lon)
+                if lat or lon:
+                    gps_candidates.append(('mediainfo', lat, lon, None))
         except:
             pass
 
-    # Try MediaInfo next
-    if MEDIAINFO_AVAILABLE:
+
+    # Fall back to hachoir, which walks the whole container in pure Python
+    if HACHOIR_AVAILABLE:
         try:
-            mi = MediaInfo.parse(path)
-            if mi and mi.tracks:
-                mediainfo_data = []
-                lat = None
-                lon = None
-                for track in mi.tracks:
-                    data = track.to_data() if hasattr(track, 'to_data') else {}
-                    # Collect all metadata
-                    for key, val in data.items():
-                        if val:
-                            mediainfo_data.append(f"{key}: {val}")
-                            # Look for GPS fields
-                            key_lower = key.lower()
-                            # Check for ISO 6709 format (com.apple.quicktime.locationiso6709)
-                            if 'iso6709' in key_lower:
-                                iso_coords = parse_iso6709(val)
-                                if iso_coords:
-                                    lat, lon = iso_coords
-                            if 'latitude' in key_lower or 'lat' in key_lower:
-                                try:
-                                    if isinstance(val, (list, tuple)):
-                                        lat = float(val[0])
-                                    else:
-                                        lat = float(val)
-                                except:
-                                    pass
-                            if 'longitude' in key_lower or 'lon' in key_lower:
-                                try:
-                                    if isinstance(val, (list, tuple)):
-                                        lon = float(val[0])
-                                    else:
-                                        lon = float(val)
-                                except:
-                                    pass
-                if lat or lon or mediainfo_data:
-                    gps_candidates.append(('mediainfo', lat, lon, mediainfo_data))
+            from hachoir.parser import createParser
+            from hachoir.metadata import extractMetadata
+            parser = createParser(str(path))
+            if parser:
+                metadata = extractMetadata(parser)
+                if metadata:
+                    # Read the typed values directly instead of parsing exportPlaintext() lines,
+                    # from every group that export covers (MP4/MOV keep some values in stream sub-groups)
+                    lat = None
+                    lon = None
+                    for group in iter_hachoir_groups(metadata):
+                        try:
+                            if group.has('latitude'):
+                                lat = float(group.get('latitude'))
+                            if group.has('longitude'):
+                                lon = float(group.get('longitude'))
+                        except (TypeError, ValueError):
+                            pass
+                    gps_candidates.append(('hachoir', lat, lon, None))
+                parser.stream._input.close()
         except:
             pass
 
@@ -516,12 +759,15 @@ def get_video_gps(path):
             return (lat, lon)
     return None
 
+# One keep-alive session so consecutive lookups reuse the TLS connection to Nominatim
+NOMINATIM_SESSION = requests.Session()
+NOMINATIM_SESSION.headers.update({"User-Agent": "PVA-Photo-Video-Annotator/1.0"})
+
 def reverse_geocode_nominatim(lat, lon):
     """Reverse geocode using OpenStreetMap Nominatim API. Returns formatted address or None."""
     try:
         url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}"
-        headers = {"User-Agent": "PVA-Photo-Video-Annotator/1.0"}
-        response = requests.get(url, timeout=2, headers=headers)
+        response = NOMINATIM_SESSION.get(url, timeout=2)
         if response.status_code == 200:
             data = response.json()
             address = data.get("address", {})
@@ -544,14 +790,39 @@ def reverse_geocode_nominatim(lat, lon):
     return None
 
 def load_image(path, rotation):
-    img = Image.open(path)
+    exif = get_exif_tags(path)
+    orientation = exif.get(EXIF_ORIENTATION_TAG, 1) if exif else 1
+
+    # No flip needed: let Qt decode and rotate the file directly, skipping the PIL -> bytes -> QImage copies
+    if orientation in (1, 3, 6, 8):
+        reader = QImageReader(str(path))
+        reader.setAutoTransform(False)  # EXIF orientation is applied below, not by the reader
+        qimg = reader.read()
+        if not qimg.isNull():
+            # Drop alpha like the PIL path's convert("RGB")
+            if qimg.hasAlphaChannel():
+                qimg = qimg.convertToFormat(QImage.Format_RGB888)
+            total = (ORIENTATION_TO_DEGREES[orientation] + (rotation or 0)) % 360
+            if total:
+                # Degrees here are counter-clockwise like PIL's rotate; QTransform.rotate turns clockwise on screen
+                qimg = qimg.transformed(QTransform().rotate(-total))
+            return qimg
+        # Qt has no reader for this format (e.g. TIFF/WebP without the imageformats plugin); use PIL
 
-    # Apply EXIF orientation if available (returns None if no EXIF, so use 'or img')
-    img = ImageOps.exif_transpose(img) or img
-
-    # Apply user rotation on top of EXIF orientation
-    if rotation:
-        img = img.rotate(rotation, expand=True)
+    img = Image.open(path)
+    if orientation in (1, 3, 6, 8):
+        # Pure rotation: combine EXIF and user rotation into one rotate call, so only one
+        # new pixel buffer is made (PIL uses a plain transpose for multiples of 90)
+        total = (ORIENTATION_TO_DEGREES[orientation] + (rotation or 0)) % 360
+        if total:
+            img = img.rotate(total, expand=True)
+    else:
+        # Flipped orientations: let exif_transpose handle the mirror (returns None if no EXIF, so use 'or img')
+        img = ImageOps.exif_transpose(img) or img
+
+        # Apply user rotation on top of EXIF orientation
+        if rotation:
+            img = img.rotate(rotation, expand=True)
 
     # Ensure RGB mode for consistency
     if img.mode != 'RGB':
@@ -565,13 +836,48 @@ def load_image(path, rotation):
     # Make a copy to ensure data persistence after PIL image is garbage collected
     return qimg.copy()
 
+def render_image(path, rotation, crop):
+    """Decode an image for display. crop is (x1, y1, x2, y2) in full-image pixels, or None.
+    Returns (full_width, full_height, QImage scaled to fit 800x600).
+    Only uses QImage (not QPixmap), so it is safe to run on a worker thread."""
+    qimg = load_image(path, rotation)
+    width, height = qimg.width(), qimg.height()
+    if crop:
+        x1, y1, x2, y2 = crop
+        qimg = qimg.copy(x1, y1, x2-x1, y2-y1)
+    return (width, height, qimg.scaled(800, 600, Qt.KeepAspectRatio))
+
+class ImageLoadNotifier(QObject):
+    """Carries finished image loads from the worker thread to the GUI thread (signals queue across threads)."""
+    loaded = Signal(object)
+
+class SaveErrorNotifier(QObject):
+    """Carries annotation write errors from the save worker to the GUI thread."""
+    failed = Signal(str)
+
+
+# Probed video durations keyed by path string; filled on demand and by the background prefetcher
+_video_duration_cache = {}
 
 def get_video_duration_ms(video_path):
+    """Get video duration in milliseconds, probing the file only the first time it is asked for.
+    Safe to call from the background prefetch thread; a duplicate probe just overwrites the same value.
+    Returns duration in milliseconds or None.
+    """
+    key = str(video_path)
+    if key in _video_duration_cache:
+        return _video_duration_cache[key]
+    duration_ms = metadata_cache.get(video_path, "duration_ms", probe_video_duration_ms)
+    _video_duration_cache[key] = duration_ms
+    return duration_ms
+
+def probe_video_duration_ms(video_path):
     """Get video duration in milliseconds using multiple methods for robustness.
     Tries TinyTag first, then falls back to MediaInfo if available.
     Returns duration in milliseconds or None.
     """
     try:
+        from tinytag import TinyTag
         tag = TinyTag.get(str(video_path), tags=False, duration=True)
         if tag and tag.duration:
             duration_ms = int(tag.duration * 1000)
@@ -581,12 +887,9 @@ def get_video_duration_ms(video_path):
 
     if MEDIAINFO_AVAILABLE:
         try:
-            mi = MediaInfo.parse(str(video_path))
-            if mi and mi.tracks:
-                for track in mi.tracks:
-                    if track.track_type == "Video":
-                        if hasattr(track, 'duration') and track.duration:
-                            return int(track.duration)
+            for data in get_mediainfo_tracks(video_path):
+                if data.get("track_type") == "Video" and data.get("duration"):
+                    return int(data["duration"])
         except Exception:
             pass
 
@@ -601,30 +904,78 @@ def format_time_ms(ms):
     seconds = total_seconds % 60
     return f"{minutes:02d}:{seconds:02d}"
 
+NEW_ANNOTATION = "new"  # AnnotationEdit.mode: text box holds a not-yet-added annotation
+EDIT_ANNOTATION = "edit"  # AnnotationEdit.mode: text box edits an existing annotation
+
+@dataclass
+class AnnotationEdit:
+    """What the text box is writing to while a video annotation is being added or edited."""
+    mode: str  # NEW_ANNOTATION or EDIT_ANNOTATION
+    time: float = 0.0  # Start time in seconds of a new annotation
+    target: dict = None  # Annotation dict being edited
+
+def bisect_annotation_time(annotations, t):
+    """bisect_right on the "time" of a time-sorted annotation list: the index after every annotation at or
+    before t. Written out because bisect only accepts key= from Python 3.10."""
+    lo, hi = 0, len(annotations)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if t < annotations[mid]["time"]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+def insert_annotation(annotations, ann):
+    """Insert ann into a video's annotation list, which is kept sorted by time
+    (sorted once at load; every write keeps it that way, so readers never re-sort)."""
+    annotations.insert(bisect_annotation_time(annotations, ann["time"]), ann)
+
+def active_annotation_index(annotations, pos_sec):
+    """Index of the active annotation (the last one starting at or before pos_sec) in a
+    time-sorted annotation list, or -1 if every annotation starts later."""
+    return bisect_annotation_time(annotations, pos_sec) - 1
+
 class TimestampSlider(QSlider):
     """Custom slider that shows timestamp tooltip on hover/click."""
     def __init__(self, parent=None):
         super().__init__(Qt.Horizontal, parent)
         self.setMouseTracking(True)
+        self.tooltip_second = None  # Whole second shown in the tooltip, None until the mouse moves
+        # A new video's range gives the same second a different position, so show the tooltip afresh
+        self.rangeChanged.connect(self.reset_tooltip)
+
+    def reset_tooltip(self, *args):
+        """Forget the shown second so the next mouse move shows the tooltip again."""
+        self.tooltip_second = None
+
+    def leaveEvent(self, event):
+        self.reset_tooltip()
+        return super().leaveEvent(event)
+
+    def value_at(self, event):
+        """Slider value under the mouse, in integer arithmetic."""
+        return int(event.position().x()) * self.maximum() // max(self.width(), 1)
 
     def mouseMoveEvent(self, event):
         # Calculate the value at the mouse position
         if self.maximum() > 0:
-            x_pos = event.position().x()
-            width = self.width()
-            value = int((x_pos / width) * self.maximum())
-            self.setToolTip(format_time_ms(value))
-            # Show tooltip immediately
-            QApplication.instance().processEvents()
+            value = self.value_at(event)
+            # The tooltip only shows whole seconds, so only reformat it when the second changes
+            second = value // 1000
+            if second != self.tooltip_second:
+                self.tooltip_second = second
+                text = format_time_ms(value)
+                self.setToolTip(text)
+                # Show tooltip immediately
+                QToolTip.showText(event.globalPosition().toPoint(), text, self)
         return super().mouseMoveEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             # Calculate value from click position
             if self.maximum() > 0:
-                x_pos = event.position().x()
-                width = self.width()
-                value = int((x_pos / width) * self.maximum())
+                value = self.value_at(event)
                 self.setValue(value)
                 # Emit sliderMoved signal to trigger position and annotation updates
                 self.sliderMoved.emit(value)
@@ -641,23 +992,23 @@ class CropImageLabel(QLabel):
         self.crop_mode = False
         self.crop_start = None
         self.crop_rect = None
-        self.original_pixmap = None
+        self.original_size = None  # QSize of the full (uncropped) image, used to map selections to image pixels
         self.setMouseTracking(True)
 
     def mousePressEvent(self, event):
-        if self.crop_mode and self.original_pixmap:
+        if self.crop_mode and self.original_size is not None:
             self.crop_start = event.position()
             self.crop_rect = None
             self.update()
 
     def mouseMoveEvent(self, event):
-        if self.crop_mode and self.crop_start and self.original_pixmap:
+        if self.crop_mode and self.crop_start and self.original_size is not None:
             # Create rectangle from start to current position
             self.crop_rect = (self.crop_start, event.position())
             self.update()
 
     def mouseReleaseEvent(self, event):
-        if self.crop_mode and self.crop_start and self.original_pixmap:
+        if self.crop_mode and self.crop_start and self.original_size is not None:
             # Finalize crop
             end_pos = event.position()
 
@@ -677,16 +1028,16 @@ class CropImageLabel(QLabel):
                         pix_y = (label_rect.height() - pix_height) / 2
 
                         # Convert label coordinates to image coordinates
-                        x1 = int((self.crop_start.x() - pix_x) * self.original_pixmap.width() / pix_width)
-                        y1 = int((self.crop_start.y() - pix_y) * self.original_pixmap.height() / pix_height)
-                        x2 = int((end_pos.x() - pix_x) * self.original_pixmap.width() / pix_width)
-                        y2 = int((end_pos.y() - pix_y) * self.original_pixmap.height() / pix_height)
+                        x1 = int((self.crop_start.x() - pix_x) * self.original_size.width() / pix_width)
+                        y1 = int((self.crop_start.y() - pix_y) * self.original_size.height() / pix_height)
+                        x2 = int((end_pos.x() - pix_x) * self.original_size.width() / pix_width)
+                        y2 = int((end_pos.y() - pix_y) * self.original_size.height() / pix_height)
 
                         # Clamp to image bounds
-                        x1 = max(0, min(x1, self.original_pixmap.width()))
-                        y1 = max(0, min(y1, self.original_pixmap.height()))
-                        x2 = max(0, min(x2, self.original_pixmap.width()))
-                        y2 = max(0, min(y2, self.original_pixmap.height()))
+                        x1 = max(0, min(x1, self.original_size.width()))
+                        y1 = max(0, min(y1, self.original_size.height()))
+                        x2 = max(0, min(x2, self.original_size.width()))
+                        y2 = max(0, min(y2, self.original_size.height()))
 
                         # Ensure coordinates are in order
                         crop_coords = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
@@ -738,8 +1089,23 @@ class PVAnnotator(QWidget):
         self.dir=None; self.media=[]; self.index=0
         self.data={}; self.slideshow=False
         self.data_changed = False  # Track if data has been modified and needs saving
+        # Coalesces saves from navigation and edits into one write after SAVE_DELAY_MS
+        self.save_timer = QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save)
+        # Single worker that writes saves to disk, in order, so the UI never waits on the disk
+        self.save_pool = ThreadPoolExecutor(max_workers=1)
+        self.save_future = None  # Most recent annotation write submitted to save_pool
+        self.save_error_notifier = SaveErrorNotifier()
+        self.save_error_notifier.failed.connect(self.show_save_error)
         self.timer=QTimer(); self.timer.timeout.connect(self.advance_slideshow)
         self.media_to_data_key = {}  # Maps index in self.media to data key (may include ##version)
+        self.media_suffix = {}  # Maps each media Path to its lowercased suffix
+        self.media_entries = {}  # Maps each media Path to its os.DirEntry from the last directory listing
+        self.location_indices = None  # Location text -> ascending media indices using it; None when stale
+        self.visible_indices = None  # Ascending media indices not marked skip; None when stale
+        self.current_annotations = None  # Annotation list of the video on screen, set by show_item
+        self.dir_scans = {}  # Directory path -> scan_media_dir result, shared by the folder prompt and media collection during a load
 
         # Widgets
         self.image_label=CropImageLabel(alignment=Qt.AlignCenter)
@@ -806,14 +1172,36 @@ class PVAnnotator(QWidget):
         self.text_box.setFont(QFont("Arial",DEFAULT_FONT_SIZE))
         # Only accept plain text to prevent formatting from pasted content
         self.text_box.setAcceptRichText(False)
-        self._text_change_in_progress = False
+        # Text last put in text_box by show_video_annotation_text; None once anything else changes the text box
+        self.shown_video_text = None
+        # Typing is copied into the data model once it pauses, into the target captured at the first keystroke
+        self.text_edit_target = None
+        self.text_edit_timer = QTimer()
+        self.text_edit_timer.setSingleShot(True)
+        self.text_edit_timer.timeout.connect(self.update_active_annotation_text)
 
         self.skip_in_progress = False
-        self.new_annotation_pending = False
+        self.annotation_edit = None  # AnnotationEdit while adding/editing a video annotation, else None
         self.is_editing_annotation_mode = False
         self.text_scroll_timer = QTimer()
         self.text_scroll_timer.timeout.connect(self.scroll_annotation_text)
         self.text_scroll_pos = 0
+        # Slideshow scroll state; None until text needing a scroll has been shown
+        self._original_annotation_text = None
+        self.text_scroll_line_index = None
+        self.text_scroll_total_lines = None
+        self.text_scroll_line_height = None
+        self.text_scroll_interval = None
+        # Single worker that probes upcoming video durations so slideshow timing never waits on file I/O
+        self.duration_probe_pool = ThreadPoolExecutor(max_workers=1)
+        self.duration_probe_pending = {}  # Path string -> Future of a queued or running probe
+        # Single worker that decodes images so navigation never waits on a large photo
+        self.image_pool = ThreadPoolExecutor(max_workers=1)
+        self.image_wanted = None  # Key of the image show_item is waiting for; other results are only cached
+        self.image_cache = OrderedDict()  # (path, rotation, crop) -> render_image result, least recently used first
+        self.image_pending = {}  # Key -> Future of each image_pool job not yet delivered
+        self.image_notifier = ImageLoadNotifier()
+        self.image_notifier.loaded.connect(self.show_loaded_image)
 
         self.video_widget=QVideoWidget()
         self.video_widget.setAutoFillBackground(True)
@@ -889,7 +1277,7 @@ class PVAnnotator(QWidget):
         layout.addWidget(self.text_box)
 
         # Live-update the active annotation while typing
-        self.text_box.textChanged.connect(self.update_active_annotation_text)
+        self.text_box.textChanged.connect(self.handle_text_changed)
 
         # Override focus out to commit annotation
         orig_focus_out = self.text_box.focusOutEvent
@@ -898,16 +1286,24 @@ class PVAnnotator(QWidget):
             # (new annotations are saved by save_pending_annotation instead)
             # Also avoid writing to the baseline 0.0 annotation while editing another
             # annotation; commit_editing_annotation handles that case instead.
-            if not self.new_annotation_pending and not self.is_editing_annotation_mode:
+            self.update_active_annotation_text()
+            if self.media_suffix[self.current()] in SUPPORTED_IMAGES:
+                # Images have no pending or edited annotations to commit
                 self.update_text()
-            # Do not auto-commit edit mode on focus loss; finish_edit_mode handles it
-            self.save_pending_annotation()         # commit new annotation if pending
+            else:
+                if self.annotation_edit is None and not self.is_editing_annotation_mode:
+                    self.update_text()
+                # Do not auto-commit edit mode on focus loss; finish_edit_mode handles it
+                self.save_pending_annotation()         # commit new annotation if pending
             orig_focus_out(event)
         self.text_box.focusOutEvent = text_focus_out
 
         # Show placeholder image (app icon) until a folder is chosen
         self.show_placeholder_image()
 
+        # Keyboard shortcuts handled by keyPressEvent
+        self.key_handlers={Qt.Key_Right: self.next_item, Qt.Key_Left: self.prev_item}
+
         self.load_directory(start_path)
 
     # ---------------- Directory ----------------
@@ -925,6 +1321,10 @@ class PVAnnotator(QWidget):
         self.pva_data_dir = self.dir / PVA_DATA_DIR
         self.pva_data_dir.mkdir(exist_ok=True)
         self.json_path = self.pva_data_dir / JSON_NAME
+        # Queued saves of a previously open folder must finish before its caches are swapped out
+        self.flush_saves()
+        metadata_cache.open(self.dir, self.pva_data_dir / METADATA_CACHE_NAME)
+        geocode_cache.open(self.pva_data_dir / GEOCODE_CACHE_NAME)
 
         # Migrate annotations.json from root to pva_data if needed
         old_json_path = self.dir / JSON_NAME
@@ -933,21 +1333,22 @@ class PVAnnotator(QWidget):
             shutil.move(str(old_json_path), str(self.json_path))
 
         if self.json_path.exists():
-            self.data=json.loads(self.json_path.read_text())
+            self.data=json.loads(self.json_path.read_bytes())
         else: self.data={"_settings":{"font_size":DEFAULT_FONT_SIZE,"image_time":DEFAULT_IMAGE_TIME}}
+        self.current_annotations = None  # Belonged to the previous self.data
         # Normalize any stored creation times to the new string format
         self.normalize_creation_times()
+        self.dir_scans = {}
         self.check_and_prompt_folders()
         # Inform user while we load and compute timestamps
-        try:
-            self.text_box.blockSignals(True)
+        with QSignalBlocker(self.text_box):
             self.text_box.setText("Loading data and checking file creation times")
-        finally:
-            self.text_box.blockSignals(False)
+        self.shown_video_text = None
         # Force UI update so user sees the message
         QApplication.processEvents()
         # Get all media files
         all_files = list(self.get_all_media_files())
+        self.dir_scans = {}  # Only needed while collecting files; later loads must see new files
 
         # Build a map of base filenames to their versioned keys
         from collections import defaultdict
@@ -958,7 +1359,9 @@ class PVAnnotator(QWidget):
                 base_to_versions[base].append(data_key)
 
         # Step 1: Ensure all files have creation_time_utc and local_time_zone (if available)
+        # Collect the files that need metadata, then read them in parallel
         needs_save = False
+        pending = {}  # filename -> first file_path with that name
         for file_path in all_files:
             base = self.get_base_filename(file_path.name)
             # Check if this file has versioned entries - if so, skip creating a base entry
@@ -967,9 +1370,15 @@ class PVAnnotator(QWidget):
 
             # Only process if: no versions exist, OR this exact filename exists in data
             if not has_versioned_entries:
-                if file_path.name not in self.data or "creation_time_utc" not in self.data.get(file_path.name, {}):
-                    self.get_cached_creation_time(file_path)
-                    needs_save = True
+                if "creation_time_utc" not in self.data.get(file_path.name, {}):
+                    pending.setdefault(file_path.name, file_path)
+        if pending:
+            pending_paths = list(pending.values())
+            pending_entries = [self.media_entries.get(p) for p in pending_paths]
+            pending_suffixes = [self.media_suffix[p] for p in pending_paths]
+            for file_path, creation_time_tuple in zip(pending_paths, scan_creation_times(pending_paths, pending_entries, pending_suffixes)):
+                self.get_cached_creation_time(file_path, creation_time_tuple)
+            needs_save = True
         if needs_save:
             self.save()
 
@@ -1008,7 +1417,7 @@ class PVAnnotator(QWidget):
                     hours, minutes = map(int, tz_str[1:].split(':'))
                     offset = timedelta(hours=sign*hours, minutes=sign*minutes)
                     tz = timezone(offset)
-                    dt_local = datetime.strptime(naive_wall_clock, DATETIME_FMT)
+                    dt_local = parse_fixed_datetime(naive_wall_clock) or datetime.strptime(naive_wall_clock, DATETIME_FMT)
                     dt_local = dt_local.replace(tzinfo=tz)
                     entry["creation_time_utc"] = dt_local.astimezone(timezone.utc).timestamp()
                     entry["creation_date_time"] = naive_wall_clock
@@ -1090,42 +1499,35 @@ class PVAnnotator(QWidget):
                     temp_media_to_data_key[len(expanded_media) - 1] = version_key
 
         # Sort the expanded media by timestamp and version
-        def sort_key_indexed(idx):
-            data_key = temp_media_to_data_key[idx]
-            entry = self.data.get(data_key, {})
-            if "creation_time_manual" in entry:
-                ts = parse_creation_value(entry["creation_time_manual"])
-                if ts is not None:
-                    version_suffix = self.get_version_suffix(data_key)
-                    return (ts, version_suffix)
-            if "creation_date_time" in entry:
-                ts = parse_creation_value(entry["creation_date_time"])
-                if ts is not None:
-                    version_suffix = self.get_version_suffix(data_key)
-                    return (ts, version_suffix)
-            version_suffix = self.get_version_suffix(data_key)
-            return (9999999999, version_suffix)
-
-        sorted_indices = sorted(range(len(expanded_media)), key=sort_key_indexed)
+        sort_keys = [self.get_sort_key(temp_media_to_data_key[idx]) for idx in range(len(expanded_media))]
+        sorted_indices = sorted(range(len(expanded_media)), key=sort_keys.__getitem__)
         self.media = [expanded_media[i] for i in sorted_indices]
 
         # Build final mapping with sorted indices
         old_to_new = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted_indices)}
         self.media_to_data_key = {old_to_new[i]: temp_media_to_data_key[i] for i in temp_media_to_data_key}
+        self.location_indices = None
+        self.visible_indices = None
 
-        if start_path and start_path.is_file() and start_path in self.media:
-            self.index=self.media.index(start_path)
-        # Sort video annotations
-        for entry in self.data.values():
-            if "annotations" in entry and isinstance(entry["annotations"], list):
-                entry["annotations"] = sorted(entry["annotations"], key=lambda a: a["time"])
-
-        # Deduplicate and ensure every video has a baseline 0.0 annotation
+        if start_path and start_path.is_file():
+            # One scan: index() both finds the file and tells us if it is missing
+            try:
+                self.index=self.media.index(start_path)
+            except ValueError:
+                pass
+        # Sort, deduplicate and ensure every video has a baseline 0.0 annotation
         needs_save_after_dedup = False
         for idx, media_path in enumerate(self.media):
-            if media_path.suffix.lower() in SUPPORTED_VIDEOS:
+            if self.media_suffix[media_path] in SUPPORTED_VIDEOS:
                 data_key = self.get_data_key(idx)
-                annotations = self.data.setdefault(data_key, {}).setdefault("annotations", [])
+                entry = self.data.setdefault(data_key, {})
+                # Remove rotation for videos (rotation only applies to images; rotate_item never sets it for videos)
+                if entry.pop("rotation", None) is not None:
+                    self.data_changed = True
+                    needs_save_after_dedup = True
+                annotations = entry.setdefault("annotations", [])
+                # Saved lists are normally already in order, which makes this a single linear pass
+                annotations.sort(key=lambda a: a["time"])
                 # First deduplicate any duplicate timestamps
                 if self.deduplicate_annotations(annotations):
                     needs_save_after_dedup = True
@@ -1146,11 +1548,9 @@ class PVAnnotator(QWidget):
             time_str = str(image_time)
         self.image_time_input.setText(f"{time_str} {time_text}")
         # Clear loading message before showing item
-        try:
-            self.text_box.blockSignals(True)
+        with QSignalBlocker(self.text_box):
             self.text_box.setText("")
-        finally:
-            self.text_box.blockSignals(False)
+        self.shown_video_text = None
 
         # Handle duplicate filenames with different timestamps
         self.handle_duplicate_filenames()
@@ -1186,7 +1586,7 @@ class PVAnnotator(QWidget):
             file_info = []
             for p in file_paths:
                 # Read the actual file's creation time
-                file_epoch, file_display, has_tz, tz_label = get_file_creation_time(p)
+                file_epoch, file_display, has_tz, tz_label = get_cached_file_creation_time(p)
                 file_info.append((p, file_epoch, file_display))
 
             # Sort by timestamp
@@ -1345,6 +1745,10 @@ class PVAnnotator(QWidget):
             # Rename the file
             file_path.rename(new_path)
             renamed_map[file_path] = new_path
+            self.media_suffix[new_path] = self.media_suffix.pop(file_path)
+            # Same file under a new name, so its probed duration still applies
+            if str(file_path) in _video_duration_cache:
+                _video_duration_cache[str(new_path)] = _video_duration_cache.pop(str(file_path))
 
             # Update data dict: move entry from old key to new key
             old_key = file_path.name
@@ -1356,30 +1760,22 @@ class PVAnnotator(QWidget):
         for i, old_path in enumerate(self.media):
             if old_path in renamed_map:
                 self.media[i] = renamed_map[old_path]
-
-        # Re-read metadata for renamed files to get separate entries
-        for old_path, new_path in renamed_map.items():
-            # Force re-read of file metadata
-            data_key = new_path.name
-            entry = self.data.get(data_key, {})
-
-            # Re-extract creation time if available
-            if new_path.suffix.lower() in SUPPORTED_IMAGES:
-                gps = get_exif_gps(new_path)
-                # The extraction will happen naturally when show_item is called
-            elif new_path.suffix.lower() in SUPPORTED_VIDEOS:
-                pass  # Video metadata extraction happens on demand
+        self.location_indices = None
+        # Location metadata for renamed files is extracted on demand when show_item reaches them
 
     # ---------------- Helpers ----------------
     def normalize_creation_times(self):
         """Convert any numeric/legacy manual creation times to the saved string format.
-        Note: legacy creation_time is left untouched per requirements.
+        Note: legacy creation_time is not converted; it is dropped (it was formerly removed on every save).
         """
         changed = False
         for name, entry in self.data.items():
             if name == "_settings" or not isinstance(entry, dict):
                 continue
-            # Only normalize manual override field; leave creation_time untouched
+            # Remove legacy creation_time field (we use creation_time_utc, creation_date_time, etc.)
+            if entry.pop("creation_time", None) is not None:
+                changed = True
+            # Only normalize manual override field
             key = "creation_time_manual"
             if key in entry:
                 ts = parse_creation_value(entry[key])
@@ -1392,10 +1788,11 @@ class PVAnnotator(QWidget):
             self.save()
 
     def current(self): return self.media[self.index]
-    def get_cached_creation_time(self, file_path):
+    def get_cached_creation_time(self, file_path, creation_time_tuple=None):
         """Get or compute creation_time_utc and local_time_zone for a file.
         Stores creation_time_utc (epoch) and local_time_zone (if available) in JSON.
         Also stores creation_local_naive when the file only provides a wall-clock time with no timezone.
+        creation_time_tuple may pass in a get_file_creation_time result that was already read.
         Returns the UTC epoch for initial sorting.
         """
         filename = file_path.name
@@ -1408,7 +1805,8 @@ class PVAnnotator(QWidget):
         )
 
         if needs_extraction:
-            creation_time_tuple = get_file_creation_time(file_path)
+            if creation_time_tuple is None:
+                creation_time_tuple = get_cached_file_creation_time(file_path)
 
             # Handle tuple return (utc_epoch, display_string, has_timezone, tz_label)
             if isinstance(creation_time_tuple, tuple) and len(creation_time_tuple) == 4:
@@ -1439,6 +1837,10 @@ class PVAnnotator(QWidget):
 
     def validate_datetime(self, dt_string):
         """Validate and convert YYYY/MM/DD HH:MM:SS (or legacy YYYY-MM-DD) to Unix timestamp."""
+        dt_obj = parse_fixed_datetime(dt_string.strip())
+        if dt_obj is not None:
+            return dt_obj.timestamp()
+        # strptime also accepts fields that are not zero-padded
         for fmt in (DATETIME_FMT, LEGACY_DATETIME_FMT):
             try:
                 dt_obj = datetime.strptime(dt_string.strip(), fmt)
@@ -1454,11 +1856,14 @@ class PVAnnotator(QWidget):
         except ValueError:
             return file_path.name
 
-    def get_visible_media(self):
-        """Return media entries not marked as skipped (or all media if in show_skipped mode)."""
+    def get_visible_indices(self):
+        """Return the ascending media indices not marked as skipped (or all indices if in show_skipped mode).
+        The skipped-filtered list is built on demand and kept until skip flags or the media order change."""
         if self.show_skipped_mode:
-            return self.media
-        return [self.media[i] for i in range(len(self.media)) if not self.data.get(self.get_data_key(i), {}).get("skip", False)]
+            return range(len(self.media))
+        if self.visible_indices is None:
+            self.visible_indices = [i for i in range(len(self.media)) if not self.data.get(self.get_data_key(i), {}).get("skip", False)]
+        return self.visible_indices
 
     def get_data_key(self, index=None):
         """Get the data dictionary key for a file, accounting for versioning.
@@ -1470,7 +1875,7 @@ class PVAnnotator(QWidget):
             index = self.index
 
         # Check if we have a versioning mapping
-        if hasattr(self, 'media_to_data_key') and index in self.media_to_data_key:
+        if index in self.media_to_data_key:
             return self.media_to_data_key[index]
 
         # Fall back to using the filename
@@ -1485,6 +1890,32 @@ class PVAnnotator(QWidget):
             return filename.split("##")[0]
         return filename
 
+    def get_sort_key(self, data_key):
+        """Return (timestamp, version_suffix) for ordering media; creation_time_manual wins over creation_date_time."""
+        version_suffix = self.get_version_suffix(data_key)
+        entry = self.data.get(data_key)
+        if not entry:
+            return (9999999999, version_suffix)  # Far future for files with no time
+        for key in ("creation_time_manual", "creation_date_time"):
+            if key in entry:
+                ts = parse_creation_value(entry[key])
+                if ts is not None:
+                    return (ts, version_suffix)
+        return (9999999999, version_suffix)  # Far future for files with no time
+
+    def get_location_indices(self):
+        """Map each non-empty location (manual text, else automated) to the ascending media indices that use it.
+        Built on demand and kept until a location or the media order changes."""
+        if self.location_indices is None:
+            location_indices = {}
+            for idx in range(len(self.media)):
+                location = self.data.get(self.get_data_key(idx), {}).get("location", {})
+                loc = location.get("manual_text", "") or location.get("automated_text", "")
+                if loc:  # Only track non-empty locations
+                    location_indices.setdefault(loc, []).append(idx)
+            self.location_indices = location_indices
+        return self.location_indices
+
     def get_version_suffix(self, filename):
         """Extract ##version suffix from filename, returns empty string if none."""
         if "##" in filename:
@@ -1625,12 +2056,12 @@ class PVAnnotator(QWidget):
             return {"type": "location"}
 
         # Check image text annotation
-        if file_path.suffix.lower() in SUPPORTED_IMAGES:
+        if self.media_suffix[file_path] in SUPPORTED_IMAGES:
             if search_text in entry.get("text", "").lower():
                 return {"type": "image_text"}
 
         # Check video annotations
-        if file_path.suffix.lower() in SUPPORTED_VIDEOS:
+        if self.media_suffix[file_path] in SUPPORTED_VIDEOS:
             annotations = entry.get("annotations", [])
             for ann in annotations:
                 if search_text in ann.get("text", "").lower():
@@ -1642,73 +2073,81 @@ class PVAnnotator(QWidget):
     def update_position_display(self):
         # Count non-skipped items up to and including current index
         if not self.show_skipped_mode:
-            current_visible_index = 0
-            total = 0
-            for idx in range(len(self.media)):
-                data_key = self.get_data_key(idx)
-                is_skipped = self.data.get(data_key, {}).get("skip", False)
-                if not is_skipped:
-                    total += 1
-                    if idx <= self.index:
-                        current_visible_index = total
+            visible = self.get_visible_indices()
+            current_visible_index = bisect_right(visible, self.index)
+            total = len(visible)
             text = f"{current_visible_index} of {total}" if total > 0 else "0 of 0"
         else:
             # In show skipped mode, show absolute position
             text = f"{self.index + 1} of {len(self.media)}"
-        self.position_box.blockSignals(True)
-        self.position_box.setText(text)
-        self.position_box.blockSignals(False)
+        with QSignalBlocker(self.position_box):
+            self.position_box.setText(text)
 
     def mark_data_changed(self):
-        """Mark data as changed and save. Convenience method for data modifications."""
+        """Mark data as changed and schedule a save. Convenience method for data modifications."""
         self.data_changed = True
-        self.save()
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Save after SAVE_DELAY_MS, restarting the delay if a save is already pending."""
+        self.save_timer.start(SAVE_DELAY_MS)
 
     def save(self):
         """Save data to JSON files only if data has changed."""
+        # An explicit save covers anything still waiting on the timer
+        self.save_timer.stop()
+        # The caches track their own changes (and lock their entries while serializing)
+        self.save_pool.submit(metadata_cache.save)
+        self.save_pool.submit(geocode_cache.save)
+
+        previous = self.save_future
+        if previous is not None and previous.done() and not previous.cancelled() and previous.exception() is not None:
+            self.data_changed = True  # The last write failed; write the current data again
+
         # Only proceed if data has actually changed
         if not self.data_changed:
             return
 
-        # Build a fast lookup set of video filenames for O(1) lookup
-        video_names = {p.name for p in self.media if p.suffix.lower() in SUPPORTED_VIDEOS}
-
-        # Clean up fields that should not be written to JSON
-        for filename in self.data:
-            if filename != "_settings":
-                # Remove rotation for videos (rotation only applies to images)
-                if filename in video_names:
-                    self.data[filename].pop("rotation", None)
-                # Remove legacy creation_time field (we use creation_time_utc, creation_date_time, etc.)
-                self.data[filename].pop("creation_time", None)
-
-        # Write the main annotations file
-        self.json_path.write_text(json.dumps(self.data, indent=2))
-
-        # Create a dated backup
+        # Serialize here, where self.data is not being modified; the worker only writes the text
+        # (serialized once; the dated backup gets the same text)
+        text = json.dumps(self.data, indent=2)
         from datetime import datetime
         today = datetime.now().strftime("%Y_%m_%d")
-        backup_filename = f"annotations_{today}.json"
-        backup_path = self.pva_data_dir / backup_filename
-        backup_path.write_text(json.dumps(self.data, indent=2))
-
-        # Reset the dirty flag after successful save
+        backup_path = self.pva_data_dir / f"annotations_{today}.json"
+        # A write still waiting in the queue is superseded by this newer snapshot
+        if previous is not None:
+            previous.cancel()
+        self.save_future = self.save_pool.submit(write_annotation_files, self.json_path, backup_path, text)
+        self.save_future.add_done_callback(self.report_save_error)
+
+        # Reset the dirty flag; a failed write sets it again on the next save
         self.data_changed = False
 
+    def report_save_error(self, future):
+        """Done-callback for annotation writes (runs on the save worker): pass a failure to the GUI thread."""
+        if not future.cancelled() and future.exception() is not None:
+            self.save_error_notifier.failed.emit(str(future.exception()))
+
+    def show_save_error(self, message):
+        """Warn that annotations could not be written; they stay marked changed so the next save retries."""
+        self.data_changed = True
+        QMessageBox.warning(self, "Save Failed", f"Could not save annotations to {self.json_path}:\n{message}")
+
+    def flush_saves(self):
+        """Wait until every save queued on save_pool has been written."""
+        self.save_pool.submit(lambda: None).result()
+
     def check_and_prompt_folders(self):
         """Check all folders (recursively) and prompt user if not already set.
         Gracefully skips folders that no longer exist."""
         def scan_folders_recursive(base_path, prefix=""):
             """Recursively scan all subfolders and prompt for each."""
             try:
-                for item in sorted(base_path.iterdir()):
-                    if item.is_dir() and item.name != TRASH_DIR and item.name != PVA_DATA_DIR:
-                        # Check if folder exists and is accessible
-                        try:
-                            item.stat()  # Check if path exists and is accessible
-                        except (OSError, FileNotFoundError):
-                            # Folder was moved/deleted - skip it
-                            continue
+                # scandir reports which entries are folders without a stat call per entry
+                _, subdirs = self.scan_dir(base_path)
+                for sub in sorted(subdirs, key=lambda e: e.name):
+                    if sub.name != TRASH_DIR and sub.name != PVA_DATA_DIR:
+                        item = Path(sub.path)
 
                         # Create folder key: relative path from self.dir
                         try:
@@ -1739,58 +2178,62 @@ class PVAnnotator(QWidget):
         scan_folders_recursive(self.dir)
         self.save()
 
+    def scan_dir(self, dir_path):
+        """scan_media_dir through self.dir_scans, so check_and_prompt_folders and
+        get_all_media_files list each directory only once per load."""
+        key = str(dir_path)
+        scan = self.dir_scans.get(key)
+        if scan is None:
+            scan = self.dir_scans[key] = scan_media_dir(dir_path)
+        return scan
+
     def get_all_media_files(self):
         """Get all media files from root and included folders (recursively).
         Gracefully handles missing folders by skipping them."""
-        files = []
+        # Each directory is listed once with os.scandir; the DirEntry objects are kept in
+        # self.media_entries so the creation-time scan can reuse their stat results
+        media = []
 
         # Add files from root directory
         try:
-            for p in self.dir.iterdir():
-                if p.is_file() and p.suffix.lower() in SUPPORTED_IMAGES|SUPPORTED_VIDEOS:
-                    files.append(p)
+            root_media, root_subdirs = self.scan_dir(self.dir)
+            media.extend(root_media)
         except (OSError, PermissionError):
             # Root directory access error - skip and continue
-            pass
+            root_subdirs = []
 
         # Add files from folders marked with use=true, including all subfolders
         def scan_folder_recursive(folder_path):
-            """Recursively collect media files from a folder."""
-            local_files = []
+            """Recursively collect (path, DirEntry, suffix) triples for media files in a folder."""
+            local_media = []
             try:
-                for item in folder_path.iterdir():
-                    if item.is_file() and item.suffix.lower() in SUPPORTED_IMAGES|SUPPORTED_VIDEOS:
-                        local_files.append(item)
-                    elif item.is_dir() and item.name != TRASH_DIR and item.name != PVA_DATA_DIR:
+                folder_media, subdirs = self.scan_dir(folder_path)
+                local_media.extend(folder_media)
+                for sub in subdirs:
+                    if sub.name != TRASH_DIR and sub.name != PVA_DATA_DIR:
                         # Recursively scan subfolders
-                        local_files.extend(scan_folder_recursive(item))
+                        local_media.extend(scan_folder_recursive(Path(sub.path)))
             except (OSError, PermissionError):
                 # Folder access error - skip this folder and continue
                 pass
-            return local_files
+            return local_media
 
-        try:
-            for item in self.dir.iterdir():
-                if item.is_dir() and item.name != TRASH_DIR and item.name != PVA_DATA_DIR:
-                    # Check if folder exists and is accessible
-                    try:
-                        item.stat()  # Check if path exists and is accessible
-                    except (OSError, FileNotFoundError):
-                        # Folder was moved/deleted - skip it
-                        continue
-
-                    # Check if this folder or any of its parent folders is marked to use
-                    try:
-                        folder_key = str(item.relative_to(self.dir))
-                    except ValueError:
-                        folder_key = item.name
-
-                    if self.data.get(folder_key, {}).get("use", False):
-                        files.extend(scan_folder_recursive(item))
-        except (OSError, PermissionError):
-            # Root directory access error - skip and continue
-            pass
+        for sub in root_subdirs:
+            if sub.name != TRASH_DIR and sub.name != PVA_DATA_DIR:
+                item = Path(sub.path)
+                # Check if this folder or any of its parent folders is marked to use
+                try:
+                    folder_key = str(item.relative_to(self.dir))
+                except ValueError:
+                    folder_key = item.name
 
+                if self.data.get(folder_key, {}).get("use", False):
+                    media.extend(scan_folder_recursive(item))
+
+        self.media_entries = {p: e for p, e, _ in media}
+        # The suffix scandir already lowercased decides image vs video for every later lookup
+        self.media_suffix = {p: suffix for p, _, suffix in media}
+        files = [p for p, _, _ in media]
         return files
 
     # ---------------- Media Display ----------------
@@ -1806,13 +2249,14 @@ class PVAnnotator(QWidget):
             return
 
         # Extract GPS from EXIF (images) or metadata (videos) if not already present
+        # The metadata cache also remembers files without GPS, so they are not re-read on every visit
         if "latitude_longitude" not in location:
             # Try image EXIF first
-            if p.suffix.lower() in SUPPORTED_IMAGES:
-                gps = get_exif_gps(file_path)
+            if self.media_suffix[p] in SUPPORTED_IMAGES:
+                gps = metadata_cache.get(file_path, "gps", get_exif_gps)
             # Try video metadata
-            elif p.suffix.lower() in SUPPORTED_VIDEOS:
-                gps = get_video_gps(file_path)
+            elif self.media_suffix[p] in SUPPORTED_VIDEOS:
+                gps = metadata_cache.get(file_path, "gps", get_video_gps)
             else:
                 gps = None
 
@@ -1828,25 +2272,29 @@ class PVAnnotator(QWidget):
             lat = location["latitude_longitude"]["latitude"]
             lon = location["latitude_longitude"]["longitude"]
 
-        # Try reverse geocoding
-        address = reverse_geocode_nominatim(lat, lon)
+        # Try reverse geocoding (a failed lookup is not retried until the next session)
+        address = geocode_cache.get(lat, lon, reverse_geocode_nominatim)
         if address:
             location["automated_text"] = address
+            self.location_indices = None
 
-        self.save()
+        self.schedule_save()
 
     def show_item(self):
         if not self.media: return
+        # Commit typing still waiting on the debounce before the text box changes items
+        self.update_active_annotation_text()
         p=self.current()
         data_key = self.get_data_key()
-        entry=self.data.setdefault(data_key,{"rotation":0,"text":""})
+        entry=self.data.setdefault(data_key,{"rotation":0,"text":""} if self.media_suffix[p] in SUPPORTED_IMAGES else {"text":""})
+        # Keep the video's annotation list at hand for the per-tick lookups in update_video_annotation
+        self.current_annotations = entry.setdefault("annotations", []) if self.media_suffix[p] in SUPPORTED_VIDEOS else None
 
         # Extract location data if available
         self.extract_and_store_location(p)
 
         # Display the time value used for sorting
         filename = data_key
-        entry = self.data.get(data_key, {})
 
         # Priority: creation_time_manual > creation_date_time
         ts = None
@@ -1866,19 +2314,17 @@ class PVAnnotator(QWidget):
             ts = "No date/time"
 
         # Update datetime box (editable)
-        self.datetime_box.blockSignals(True)
-        self.datetime_box.setText(ts)
-        self.datetime_box.blockSignals(False)
+        with QSignalBlocker(self.datetime_box):
+            self.datetime_box.setText(ts)
 
         # Update filename label (read-only) - include version suffix if present
         display_path = self.get_relative_path(p)
         version_suffix = self.get_version_suffix(data_key)
         if version_suffix:
             display_path = display_path + " " + version_suffix
-        self.filename_label.blockSignals(True)
-        self.filename_label.setText(display_path)
-        self.filename_label.setCursorPosition(0)  # Keep cursor at start to show beginning of path
-        self.filename_label.blockSignals(False)
+        with QSignalBlocker(self.filename_label):
+            self.filename_label.setText(display_path)
+            self.filename_label.setCursorPosition(0)  # Keep cursor at start to show beginning of path
 
         # Update position display (1-based, non-skipped)
         self.update_position_display()
@@ -1886,28 +2332,19 @@ class PVAnnotator(QWidget):
         # Dropdown locations - sorted by distance to current file
         current_loc=entry.get("location",{}).get("manual_text","") or entry.get("location",{}).get("automated_text","")
 
-        # Collect all unique locations and find files that have them
-        location_files = {}  # location -> list of (index, file_path)
-        for idx, file_path in enumerate(self.media):
-            file_data_key = self.get_data_key(idx)
-            file_entry = self.data.get(file_data_key, {})
-            loc = file_entry.get("location", {}).get("manual_text", "") or file_entry.get("location", {}).get("automated_text", "")
-            if loc:  # Only track non-empty locations
-                if loc not in location_files:
-                    location_files[loc] = []
-                location_files[loc].append((idx, file_path))
-
-        # Calculate distance for each location (minimum distance to current file)
+        # Find the file nearest to the current one for each location (ties go to the earlier file)
         current_idx = self.index
         location_distances = {}  # location -> (min_distance, min_index_at_that_distance)
-        for loc, files in location_files.items():
+        for loc, indices in self.get_location_indices().items():
+            pos = bisect_left(indices, current_idx)
             min_distance = float('inf')
             min_index = float('inf')
-            for idx, _ in files:
-                distance = abs(idx - current_idx)
-                if distance < min_distance or (distance == min_distance and idx < min_index):
-                    min_distance = distance
-                    min_index = idx
+            if pos > 0:
+                min_index = indices[pos - 1]
+                min_distance = current_idx - min_index
+            if pos < len(indices) and indices[pos] - current_idx < min_distance:
+                min_index = indices[pos]
+                min_distance = min_index - current_idx
             location_distances[loc] = (min_distance, min_index)
 
         # Sort locations by distance (descending - most distant first), then by index (ascending)
@@ -1915,23 +2352,23 @@ class PVAnnotator(QWidget):
         sorted_locations = sorted(location_distances.items(), key=lambda x: (-x[1][0], x[1][1]))
 
         # Populate dropdown with sorted locations, then current location at bottom
-        self.location_combo.blockSignals(True)
-        self.location_combo.clear()
+        with QSignalBlocker(self.location_combo):
+            self.location_combo.clear()
 
-        # Add all other locations (excluding current location to avoid duplicates)
-        for loc, _ in sorted_locations:
-            if loc != current_loc:
-                self.location_combo.addItem(loc)
+            # Add all other locations (excluding current location to avoid duplicates)
+            for loc, _ in sorted_locations:
+                if loc != current_loc:
+                    self.location_combo.addItem(loc)
 
-        # Always add current location at the bottom (or empty string if no location)
-        self.location_combo.addItem(current_loc if current_loc else "")
+            # Always add current location at the bottom (or empty string if no location)
+            self.location_combo.addItem(current_loc if current_loc else "")
 
-        # Set current index to the last item (current file's location)
-        self.location_combo.setCurrentIndex(self.location_combo.count() - 1)
-        self.location_combo.blockSignals(False)
+            # Set current index to the last item (current file's location)
+            self.location_combo.setCurrentIndex(self.location_combo.count() - 1)
 
         # Text box
-        if p.suffix.lower() in SUPPORTED_IMAGES:
+        self.shown_video_text = None
+        if self.media_suffix[p] in SUPPORTED_IMAGES:
             text = entry.get("text","")
             self.text_box.setText(text)
             # If slideshow is active, wrap text and prepare for scrolling
@@ -1939,7 +2376,11 @@ class PVAnnotator(QWidget):
                 self._prepare_text_for_slideshow(text)
         else:
             annotations = self.get_current_video_annotations()
-            ann0 = next((a for a in annotations if a.get("time") == 0.0), None)
+            # Annotations are kept sorted, so the baseline 0.0 annotation is normally first
+            if annotations[0].get("time") == 0.0:
+                ann0 = annotations[0]
+            else:
+                ann0 = next((a for a in annotations if a.get("time") == 0.0), None)
             text = ann0.get("text", "") if ann0 else ""
             self.text_box.setText(text)
             # If slideshow is active, wrap text and prepare for scrolling
@@ -1948,7 +2389,7 @@ class PVAnnotator(QWidget):
 
         self.setFocus()
         # Media display
-        if p.suffix.lower() in SUPPORTED_IMAGES:
+        if self.media_suffix[p] in SUPPORTED_IMAGES:
             self.video_widget.hide(); self.video_slider.hide()
             for b in [self.play_btn,self.replay_btn,self.add_ann_btn,self.edit_ann_btn,
                       self.remove_ann_btn,self.skip_ann_btn]: b.hide()
@@ -1975,22 +2416,13 @@ class PVAnnotator(QWidget):
             self.volume_btn.setStyleSheet("color: gray;")  # Gray out the text
             self.image_label.show()
             rot=entry.get("rotation",0)
-            qimg=load_image(p,rot)
-            pix=QPixmap.fromImage(qimg)
-
-            # Store original pixmap for crop selection
-            self.image_label.original_pixmap = pix
-
-            # Apply crop if it exists
+            # Decode (and apply any crop) on the worker; the previous picture stays up until it is ready
             crop_coords = entry.get("crop")
+            self.request_image(p, rot, crop_coords)
             if crop_coords:
-                x1, y1, x2, y2 = crop_coords
-                cropped_pix = pix.copy(x1, y1, x2-x1, y2-y1)
-                self.image_label.setPixmap(cropped_pix.scaled(800,600,Qt.KeepAspectRatio))
                 self.crop_btn.setText("Uncrop")
                 self.crop_btn.setStyleSheet("background-color: black; color: white; font-weight: bold;")
             else:
-                self.image_label.setPixmap(pix.scaled(800,600,Qt.KeepAspectRatio))
                 self.crop_btn.setText("Crop")
                 if sys.platform.startswith('linux') or sys.platform == 'darwin':
                     self.crop_btn.setStyleSheet("QPushButton { color: black; font-weight: bold; }")
@@ -2034,17 +2466,24 @@ class PVAnnotator(QWidget):
             volume = entry.get("volume", 100)
             self.audio_output.setVolume(volume / 100.0)
             self.volume_btn.setText(f"{volume}% volume")
-            # Full reset: stop any current playback and clear source before showing widget
-            self.video_player.stop()
-            self.video_player.setSource(QUrl())
-            # Process events to ensure old video is cleared before showing widget
-            QApplication.processEvents()
-            # Now show the video widget and slider with cleared state
-            self.video_widget.show(); self.video_slider.show()
-            # Set new source and play
-            self.video_player.setSource(QUrl.fromLocalFile(str(p)))
-            # Use a single-shot timer to allow the source to load before playing
-            QTimer.singleShot(100, self.video_player.play)
+            url = QUrl.fromLocalFile(str(p))
+            if self.video_player.source() == url and self.video_player.mediaStatus() != QMediaPlayer.MediaStatus.InvalidMedia:
+                # Same video shown again (e.g. after Unskip): it is already loaded, so just restart it
+                self.video_widget.show(); self.video_slider.show()
+                self.video_player.setPosition(0)
+                self.video_player.play()
+            else:
+                # Full reset: stop any current playback and clear source before showing widget
+                self.video_player.stop()
+                self.video_player.setSource(QUrl())
+                # Process events to ensure old video is cleared before showing widget
+                QApplication.processEvents()
+                # Now show the video widget and slider with cleared state
+                self.video_widget.show(); self.video_slider.show()
+                # Set new source and play
+                self.video_player.setSource(url)
+                # Use a single-shot timer to allow the source to load before playing
+                QTimer.singleShot(100, self.video_player.play)
 
         # Update Skip button text and styling based on whether current file is skipped
         if entry.get("skip", False):
@@ -2061,7 +2500,73 @@ class PVAnnotator(QWidget):
         # Next/Prev labels stay constant now that position box exists
         self.prev_btn.setText("Previous")
         self.next_btn.setText("Next")
-        self.save()
+        self.schedule_save()
+        self.prefetch_video_durations()
+
+    def prefetch_video_durations(self, count=5):
+        """Queue background duration probes for the next few videos after the current item."""
+        found = 0
+        for offset in range(1, len(self.media)):
+            p = self.media[(self.index + offset) % len(self.media)]
+            if self.media_suffix[p] not in SUPPORTED_VIDEOS:
+                continue
+            key = str(p)
+            if key not in _video_duration_cache and key not in self.duration_probe_pending:
+                future = self.duration_probe_pool.submit(get_video_duration_ms, p)
+                self.duration_probe_pending[key] = future
+                future.add_done_callback(lambda _, k=key: self.duration_probe_pending.pop(k, None))
+            found += 1
+            if found >= count:
+                break
+
+    def request_image(self, p, rotation, crop):
+        """Show image p: immediately if it is in image_cache, otherwise once the worker has decoded it."""
+        key = (p, rotation, tuple(crop) if crop else None)
+        self.image_wanted = key
+        if key in self.image_cache:
+            self.image_cache.move_to_end(key)
+            self.display_image(self.image_cache[key])
+        else:
+            self.submit_image(key)
+        # Decode the neighbors next, so sequential browsing finds them in the cache
+        for index in (self.index + 1, self.index - 1):
+            if 0 <= index < len(self.media) and self.media_suffix[self.media[index]] in SUPPORTED_IMAGES:
+                entry = self.data.get(self.get_data_key(index), {})
+                crop = entry.get("crop")
+                self.submit_image((self.media[index], entry.get("rotation", 0), tuple(crop) if crop else None))
+
+    def submit_image(self, key):
+        """Queue a render_image job for key unless it is already cached or queued."""
+        if key in self.image_cache or key in self.image_pending:
+            return
+        future = self.image_pool.submit(render_image, *key)
+        self.image_pending[key] = future
+        future.add_done_callback(lambda f: self.image_notifier.loaded.emit((key, f)))
+
+    def show_loaded_image(self, result):
+        """Cache a finished image load and display it if it is still the image being waited for."""
+        key, future = result
+        self.image_pending.pop(key, None)
+        try:
+            rendered = future.result()
+        except Exception:
+            if key == self.image_wanted:
+                # Unreadable image: show nothing rather than the previous file's picture
+                self.image_label.original_size = None
+                self.image_label.setPixmap(QPixmap())
+            return
+        self.image_cache[key] = rendered
+        if len(self.image_cache) > IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+        if key == self.image_wanted:
+            self.display_image(rendered)
+
+    def display_image(self, rendered):
+        """Put a render_image result on image_label."""
+        width, height, display = rendered
+        # Store the full image size for crop selection
+        self.image_label.original_size = QSize(width, height)
+        self.image_label.setPixmap(QPixmap.fromImage(display))
 
     def show_placeholder_image(self):
         """Display the app icon in the media area before any folder is opened."""
@@ -2118,20 +2623,18 @@ class PVAnnotator(QWidget):
         zero_ann = next((a for a in annotations if a.get("time") == 0.0), None)
         added = False
         if zero_ann is None:
-            annotations.append({"time": 0.0, "text": ""})
+            insert_annotation(annotations, {"time": 0.0, "text": ""})
             added = True
         else:
             if "text" not in zero_ann:
                 zero_ann["text"] = ""
                 added = True
-        if added:
-            annotations.sort(key=lambda a: a["time"])
         return added
 
     def get_current_video_annotations(self):
-        p = self.current()
-        data_key = self.get_data_key()
-        annotations = self.data.setdefault(data_key, {}).setdefault("annotations", [])
+        annotations = self.current_annotations
+        if annotations is None:
+            annotations = self.data.setdefault(self.get_data_key(), {}).setdefault("annotations", [])
         if self.ensure_zero_annotation(annotations):
             self.save()
         return annotations
@@ -2159,15 +2662,6 @@ class PVAnnotator(QWidget):
         except Exception:
             self.seek_in_progress = False
 
-    def jump_to_end_and_pause(self):
-        """Seek to final frame and pause, keeping the last frame visible."""
-        dur = self.video_player.duration()
-        if dur <= 0:
-            return
-        # Seek slightly before the exact end to keep a frame available
-        target = max(dur - 100, 0)
-        self.safe_seek(target, play_brief=True)
-
     def jump_to_end_and_pause(self):
         """Seek to final frame and pause, keeping the last frame visible."""
         dur = self.video_player.duration()
@@ -2183,40 +2677,28 @@ class PVAnnotator(QWidget):
         if self.seek_in_progress:
             return
 
-        if hasattr(self, "editing_annotation"):
+        if self.annotation_edit is not None and self.annotation_edit.mode == EDIT_ANNOTATION:
             # Skip updating the text box while editing
             return
 
         self.commit_editing_annotation()
 
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         pos_sec = pos / 1000.0
         annotations = self.get_current_video_annotations()
         if not annotations:
-            self.text_box.blockSignals(True)
-            self.text_box.setText("")
-            self.text_box.blockSignals(False)
+            self.show_video_annotation_text("")
             return
 
-        annotations.sort(key=lambda a: a["time"])
-
-        active_ann = None
-        for i, ann in enumerate(annotations):
-            if ann["time"] <= pos_sec:
-                active_ann = (i, ann)
-            else:
-                break
-
-        if not active_ann:
-            self.text_box.blockSignals(True)
-            self.text_box.setText("")
-            self.text_box.blockSignals(False)
+        i = active_annotation_index(annotations, pos_sec)
+        if i < 0:
+            self.show_video_annotation_text("")
             return
 
-        i, ann = active_ann
+        ann = annotations[i]
 
         # Handle skip annotation
         if ann.get("skip", False):
@@ -2233,21 +2715,24 @@ class PVAnnotator(QWidget):
                 else:
                     # Last annotation: just pause here
                     self.video_player.pause()
-                    self.text_box.blockSignals(True)
-                    self.text_box.setText("Segment skipped")
-                    self.text_box.blockSignals(False)
+                    self.show_video_annotation_text("Segment skipped")
                 return
             else:
                 # Paused or manual seek: always show "Segment skipped"
-                self.text_box.blockSignals(True)
-                self.text_box.setText("Segment skipped")
-                self.text_box.blockSignals(False)
+                self.show_video_annotation_text("Segment skipped")
                 return
 
         # Normal annotation
-        self.text_box.blockSignals(True)
-        self.text_box.setText(ann.get("text", ""))
-        self.text_box.blockSignals(False)
+        self.show_video_annotation_text(ann.get("text", ""))
+
+    def show_video_annotation_text(self, text):
+        """Show text in the text box without emitting textChanged.
+        Called on every playback tick, so the text box is left alone (no re-layout) when it already shows text.
+        Compares with the last text set here rather than serializing the document with toPlainText()."""
+        if self.shown_video_text != text:
+            with QSignalBlocker(self.text_box):
+                self.text_box.setText(text)
+            self.shown_video_text = text
 
     def handle_video_end(self, status):
         """Handle video reaching the end - reset to first non-skipped segment or beginning."""
@@ -2263,13 +2748,12 @@ class PVAnnotator(QWidget):
 
         # Find first non-skipped annotation
         p = self.current()
-        if p.suffix.lower() in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] in SUPPORTED_VIDEOS:
             annotations = self.get_current_video_annotations()
 
             # Find the first non-skipped annotation
             reset_time = 0  # Default to beginning if all are skipped
             if annotations:
-                annotations.sort(key=lambda a: a["time"])
                 for ann in annotations:
                     if not ann.get("skip", False):
                         reset_time = ann["time"]
@@ -2285,7 +2769,7 @@ class PVAnnotator(QWidget):
     def skip_until_next_annotation(self):
         self.stop_slideshow_if_running()
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         # Use the slider's position (immediately reflects user drag) instead of the player
@@ -2299,12 +2783,11 @@ class PVAnnotator(QWidget):
                 return
 
         # Add skip annotation with text
-        annotations.append({
+        insert_annotation(annotations, {
             "time": pos_sec,
             "text": "Segment skipped",
             "skip": True  # Skip annotation - only include when true
         })
-        annotations.sort(key=lambda a: a["time"])
         self.save()
 
         # Jump to next annotation if exists, else pause at end
@@ -2317,94 +2800,71 @@ class PVAnnotator(QWidget):
         self.update_video_annotation(self.video_player.position())
 
     def save_pending_annotation(self):
-        if not self.new_annotation_pending:
+        edit = self.annotation_edit
+        if edit is None or edit.mode != NEW_ANNOTATION:
             return
+        self.annotation_edit = None
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
-            self.new_annotation_pending = False
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
         text = self.text_box.toPlainText().strip()
         if text:
             annotations = self.get_current_video_annotations()
-            annotations.append({
-                "time": getattr(self, "new_annotation_timestamp", self.video_player.position()/1000.0),
+            insert_annotation(annotations, {
+                "time": edit.time,
                 "text": text
             })
-            annotations.sort(key=lambda a: a["time"])
             self.mark_data_changed()
-        self.new_annotation_pending = False
-        if hasattr(self, "new_annotation_timestamp"):
-            delattr(self, "new_annotation_timestamp")
 
     def add_annotation(self):
         self.stop_slideshow_if_running()
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
         if self.video_player.playbackState() != QMediaPlayer.PausedState:
             self.video_player.pause()
-        self.new_annotation_pending = True
-        self.new_annotation_timestamp = self.video_player.position() / 1000.0
+        self.annotation_edit = AnnotationEdit(NEW_ANNOTATION, time=self.video_player.position() / 1000.0)
         self.text_box.clear()
         self.text_box.setFocus()
-        cursor = self.text_box.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.text_box.setTextCursor(cursor)
+        self.text_box.moveCursor(QTextCursor.End)
 
     def edit_annotation(self):
         self.stop_slideshow_if_running()
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         # Commit any pending new annotation first
         self.save_pending_annotation()
         self.commit_editing_annotation()  # Commit any currently editing annotation
 
-        # Use the slider's value, which reflects the exact position the user sees.
-        pos_sec = self.video_slider.value() / 1000.0
-        annotations = self.get_current_video_annotations()  # get real list
-        annotations.sort(key=lambda a: a["time"])           # sort in-place
-
-        # Pick the active annotation: the last one whose start time is <= position.
-        idx = None
-        for i, ann in enumerate(annotations):
-            if ann["time"] <= pos_sec + 1e-6:  # tolerate tiny float drift
-                idx = i
-            else:
-                break
-        if idx is None:
-            idx = 0
-        self.editing_annotation = annotations[idx]
-        self.editing_annotation_idx = idx
-        self.text_box.setText(self.editing_annotation.get("text", ""))
+        # Pick the active annotation at the slider's position, which is exactly what the user sees
+        active = self._find_active_annotation()
+        self.annotation_edit = AnnotationEdit(EDIT_ANNOTATION, target=active)
+        self.text_box.setText(active.get("text", ""))
         self.text_box.setFocus()
-        cursor = self.text_box.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.text_box.setTextCursor(cursor)
+        # moveCursor also scrolls the cursor into view
         self.text_box.moveCursor(QTextCursor.End)
-        self.text_box.ensureCursorVisible()
         self.set_slider_edit_mode(True)
         self.is_editing_annotation_mode = True
         self.edit_ann_btn.setText("Done editing")
 
     def commit_editing_annotation(self):
-        if hasattr(self, "editing_annotation"):
-            self.editing_annotation["text"] = self.text_box.toPlainText()
+        edit = self.annotation_edit
+        if edit is not None and edit.mode == EDIT_ANNOTATION:
+            edit.target["text"] = self.text_box.toPlainText()
             self.mark_data_changed()
-            # Keep index in sync only while editing; remove both markers together
-            if hasattr(self, "editing_annotation_idx"):
-                del self.editing_annotation_idx
-            del self.editing_annotation
+            self.annotation_edit = None
             self.set_slider_edit_mode(False)
 
     def update_editing_annotation_timestamp(self, pos_ms=None):
         """When editing, move the annotation start time to the slider (or player) position."""
-        if not hasattr(self, "editing_annotation"):
+        edit = self.annotation_edit
+        if edit is None or edit.mode != EDIT_ANNOTATION:
             return
 
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         # Prefer the slider value we were given; fall back to the player's position
@@ -2414,7 +2874,8 @@ class PVAnnotator(QWidget):
         pos_sec = pos_ms / 1000.0
 
         annotations = self.get_current_video_annotations()
-        self.editing_annotation["time"] = pos_sec
+        edit.target["time"] = pos_sec
+        # Moving a start time is the one write that can reorder the list
         annotations.sort(key=lambda a: a["time"])
         self.mark_data_changed()
 
@@ -2432,12 +2893,14 @@ class PVAnnotator(QWidget):
 
     def handle_button_click(self, func):
         """Finish editing (if active) and cancel crop mode before running a button action."""
+        self.update_active_annotation_text()
         self.finish_edit_mode()
         self.cancel_crop_mode()  # Cancel crop mode if active
         func()
 
     def toggle_edit_mode(self):
         """Toggle between entering edit mode and finishing it."""
+        self.update_active_annotation_text()
         self.stop_slideshow_if_running()
         if self.is_editing_annotation_mode:
             self.finish_edit_mode()
@@ -2452,63 +2915,70 @@ class PVAnnotator(QWidget):
         self.edit_ann_btn.setText("Done editing" if editing else "Edit annotation")
 
     def _find_active_annotation(self):
-        """Return the active annotation object based on the current slider position."""
+        """Return the active annotation object based on the current slider position
+        (the first annotation if the slider is before all of them)."""
         annotations = self.get_current_video_annotations()
         pos_sec = self.video_slider.value() / 1000.0
-        active = None
-        for ann in annotations:
-            if ann.get("time", 0.0) <= pos_sec + 1e-6:
-                active = ann
-            else:
-                break
-        return active or annotations[0]
+        # Tolerate tiny float drift between slider milliseconds and stored seconds
+        return annotations[max(active_annotation_index(annotations, pos_sec + 1e-6), 0)]
 
-    def update_active_annotation_text(self):
-        """While typing, update text in the active annotation (but don't save yet).
-        Text will be saved when focus leaves the text box."""
+    def handle_text_changed(self):
+        """Pause video while typing and schedule the model update for when typing pauses."""
+        # The text box no longer holds what show_video_annotation_text put there
+        self.shown_video_text = None
         # CRITICAL: Never save wrapped text during slideshow
         # Text box contains wrapped version; we only save original after slideshow ends
         if self.slideshow:
             return
 
-        if self._text_change_in_progress:
-            return
-        self._text_change_in_progress = True
-
-        try:
-            p = self.current()
-            # Pause video while typing
-            if p.suffix.lower() in SUPPORTED_VIDEOS and self.video_player.playbackState() == QMediaPlayer.PlayingState:
-                self.video_player.pause()
+        p = self.current()
+        # Pause video while typing
+        if self.media_suffix[p] in SUPPORTED_VIDEOS and self.video_player.playbackState() == QMediaPlayer.PlayingState:
+            self.video_player.pause()
 
-            # When creating a new annotation, let save_pending_annotation handle persistence
-            if self.new_annotation_pending:
-                return
+        # When creating a new annotation, let save_pending_annotation handle persistence
+        edit = self.annotation_edit
+        if edit is not None and edit.mode == NEW_ANNOTATION:
+            return
 
-            if p.suffix.lower() in SUPPORTED_IMAGES:
-                data_key = self.get_data_key()
-                self.data.setdefault(data_key, {})["text"] = self.text_box.toPlainText()
-            else:
+        # Pick the target on the first keystroke; later keystrokes only push the timer back
+        if self.text_edit_target is None:
+            if self.media_suffix[p] in SUPPORTED_IMAGES:
+                self.text_edit_target = self.data.setdefault(self.get_data_key(), {})
+            elif edit is not None:
                 # If we're editing a specific annotation, keep using that; otherwise pick active
-                if hasattr(self, "editing_annotation"):
-                    target = self.editing_annotation
-                else:
-                    target = self._find_active_annotation()
-
-                target["text"] = self.text_box.toPlainText()
+                self.text_edit_target = edit.target
+            else:
+                self.text_edit_target = self._find_active_annotation()
+        self.text_edit_timer.start(250)
 
-            # Mark data as changed so it will be saved when appropriate
-            self.data_changed = True
-        finally:
-            self._text_change_in_progress = False
+    def update_active_annotation_text(self):
+        """Copy typed text into the annotation targeted when typing began.
+        The write to disk goes through save_timer, so a burst of typing pauses becomes one save
+        (focus leaving the text box still saves at once). Safe to call when nothing is pending."""
+        self.text_edit_timer.stop()
+        target = self.text_edit_target
+        if target is None:
+            return
+        self.text_edit_target = None
+        if self.slideshow:
+            return
+        text = self.text_box.toPlainText()
+        # Typing that ends where it started (or a programmatic setText) leaves nothing to save
+        if target.get("text") == text:
+            return
+        target["text"] = text
+        self.mark_data_changed()
 
     # ---------------- Text Box Focus ----------------
     def text_focus_out(self, event):
         """Commit any new or edited annotation when text box loses focus."""
-        # Keep edit mode active when focus leaves the text box; only finish via buttons.
-        if not self.is_editing_annotation_mode:
-            self.commit_editing_annotation()
-        self.save_pending_annotation()
+        # Images have no pending or edited annotations to commit
+        if self.media_suffix[self.current()] in SUPPORTED_VIDEOS:
+            # Keep edit mode active when focus leaves the text box; only finish via buttons.
+            if not self.is_editing_annotation_mode:
+                self.commit_editing_annotation()
+            self.save_pending_annotation()
         # Save if data was changed during typing
         if self.data_changed:
             self.save()
@@ -2517,7 +2987,7 @@ class PVAnnotator(QWidget):
     def text_focus_in(self, event):
         """Pause video when text box gains focus."""
         p = self.current()
-        if p.suffix.lower() in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] in SUPPORTED_VIDEOS:
             self.video_player.pause()
         QTextEdit.focusInEvent(self.text_box, event)
 
@@ -2525,7 +2995,7 @@ class PVAnnotator(QWidget):
     def remove_annotation(self):
         self.stop_slideshow_if_running()
         p = self.current()
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         self.video_player.pause()
@@ -2535,18 +3005,9 @@ class PVAnnotator(QWidget):
         if not annotations:
             return
 
-        # Ensure sorted
-        annotations.sort(key=lambda a: a["time"])
-
         # Find active annotation: last one with time <= current time
-        active_idx = None
-        for i, ann in enumerate(annotations):
-            if ann["time"] <= pos_sec:
-                active_idx = i
-            else:
-                break
-
-        if active_idx is None:
+        active_idx = active_annotation_index(annotations, pos_sec)
+        if active_idx < 0:
             return
 
         active_ann = annotations[active_idx]
@@ -2554,9 +3015,9 @@ class PVAnnotator(QWidget):
         # Never remove the baseline 0.0 annotation; just clear its text
         if active_ann.get("time") == 0.0:
             active_ann["text"] = ""
-            self.text_box.blockSignals(True)
-            self.text_box.setText("")
-            self.text_box.blockSignals(False)
+            with QSignalBlocker(self.text_box):
+                self.text_box.setText("")
+            self.shown_video_text = None
             self.mark_data_changed()
             return
 
@@ -2584,27 +3045,22 @@ class PVAnnotator(QWidget):
 
         p=self.current()
         data_key = self.get_data_key()
-        if p.suffix.lower() in SUPPORTED_IMAGES:
-            self.data.setdefault(data_key,{})["text"]=self.text_box.toPlainText()
+        if self.media_suffix[p] in SUPPORTED_IMAGES:
+            target = self.data.setdefault(data_key,{})
         else:
             # For videos, write to the active annotation instead of forcing 0.0
-            annotations=self.get_current_video_annotations()
-            pos_sec = self.video_slider.value() / 1000.0
-            active = None
-            for ann in annotations:
-                if ann.get("time",0.0) <= pos_sec + 1e-6:
-                    active = ann
-                else:
-                    break
-            if active is None:
-                active = annotations[0]
-            active["text"] = self.text_box.toPlainText()
+            target = self._find_active_annotation()
+        text = self.text_box.toPlainText()
+        if target.get("text") == text:
+            return
+        target["text"] = text
         self.mark_data_changed()
 
     def update_location_text(self,text):
         p=self.current()
         data_key = self.get_data_key()
         self.data.setdefault(data_key,{}).setdefault("location",{})["manual_text"]=text
+        self.location_indices = None
         self.mark_data_changed()
 
     def update_creation_time(self):
@@ -2618,38 +3074,28 @@ class PVAnnotator(QWidget):
             QMessageBox.warning(self, "Invalid Format", "Please use YYYY/MM/DD HH:MM:SS (e.g., 2024/12/31 14:30:00)")
             creation_time = self.get_cached_creation_time(p)
             ts = format_creation_timestamp(creation_time)
-            self.datetime_box.blockSignals(True)
-            self.datetime_box.setText(ts)
-            self.datetime_box.blockSignals(False)
+            with QSignalBlocker(self.datetime_box):
+                self.datetime_box.setText(ts)
             return
 
         entry = self.data.setdefault(data_key, {})
         entry["creation_time_manual"] = text
         self.save()
 
-        self.datetime_box.blockSignals(True)
-        self.datetime_box.setText(text)
-        self.datetime_box.blockSignals(False)
+        with QSignalBlocker(self.datetime_box):
+            self.datetime_box.setText(text)
 
         # Re-sort media with versioned entries
         def sort_key_indexed(idx):
-            key = self.media_to_data_key.get(idx, self.media[idx].name)
-            entry = self.data.get(key, {})
-            if "creation_time_manual" in entry:
-                ts = parse_creation_value(entry["creation_time_manual"])
-                if ts is not None:
-                    version_suffix = self.get_version_suffix(key)
-                    return (ts, version_suffix)
-            if "creation_date_time" in entry:
-                ts = parse_creation_value(entry["creation_date_time"])
-                if ts is not None:
-                    version_suffix = self.get_version_suffix(key)
-                    return (ts, version_suffix)
-            version_suffix = self.get_version_suffix(key)
-            return (9999999999, version_suffix)
+            return self.get_sort_key(self.media_to_data_key.get(idx, self.media[idx].name))
 
-        # Sort indices
-        sorted_indices = sorted(range(len(self.media)), key=sort_key_indexed)
+        # Only this file's key changed and the rest stay in order, so bisect for its new place instead of
+        # sorting every file again. The index breaks ties, so equal keys keep their old relative order
+        # as they did under the stable sort.
+        others = [idx for idx in range(len(self.media)) if idx != self.index]
+        other_keys = [(sort_key_indexed(idx), idx) for idx in others]
+        new_position = bisect_left(other_keys, (sort_key_indexed(self.index), self.index))
+        sorted_indices = others[:new_position] + [self.index] + others[new_position:]
 
         # Rebuild media and mapping in sorted order
         old_media = self.media[:]
@@ -2660,12 +3106,10 @@ class PVAnnotator(QWidget):
         # Create new mapping with sorted indices
         old_to_new = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted_indices)}
         self.media_to_data_key = {old_to_new[old_idx]: old_mapping[old_idx] for old_idx in old_mapping}
+        self.location_indices = None
+        self.visible_indices = None
 
-        # Find where current file ended up in the new order
-        for idx, key in self.media_to_data_key.items():
-            if key == data_key:
-                self.index = idx
-                break
+        self.index = new_position
 
         self.update_position_display()
         self.show_item()
@@ -2677,7 +3121,7 @@ class PVAnnotator(QWidget):
         words = text.split()
         for word in words:
             # Strip out non-numeric characters except decimal point
-            num_str = ''.join(c for c in word if c.isdigit() or c == '.')
+            num_str = NON_NUMERIC_RE.sub('', word)
             if num_str and num_str != '.':
                 try:
                     new_time = float(num_str)
@@ -2719,11 +3163,11 @@ class PVAnnotator(QWidget):
         self.timer.stop()
         self.text_scroll_timer.stop()
 
-        if p.suffix.lower() in SUPPORTED_IMAGES:
-            text = self.text_box.toPlainText()
-            text_lines = text.split('\n')
-            explicit_lines = len(text_lines)  # Number of line breaks + 1
-            char_count = len(text)
+        if self.media_suffix[p] in SUPPORTED_IMAGES:
+            # Read sizes from the document itself; the text is only serialized if words must be counted
+            doc = self.text_box.document()
+            explicit_lines = doc.blockCount()  # Number of line breaks + 1
+            char_count = doc.characterCount() - 1  # characterCount includes the final paragraph separator
 
             # Calculate how many display lines are needed
             # User sees ~160 chars per line at current font size
@@ -2736,7 +3180,7 @@ class PVAnnotator(QWidget):
             elif char_count <= 300 and num_lines <= 3:
                 # Up to 300 characters and up to two line breaks: use max(delay, word_count_formula)
                 if image_time > 1:
-                    duration = max(image_time, len(text.split()) / 4) * 1000
+                    duration = max(image_time, len(self.text_box.toPlainText().split()) / 4) * 1000
                     self.timer.start(int(duration))
                 else:
                     self.timer.start(image_time_ms)
@@ -2780,7 +3224,7 @@ class PVAnnotator(QWidget):
     # ---------------- Navigation ----------------
     def jump_to_position(self):
         """Jump to a 1-based position within non-skipped media."""
-        visible = self.get_visible_media()
+        visible = self.get_visible_indices()
         total = len(visible)
         if total == 0:
             self.update_position_display()
@@ -2795,43 +3239,39 @@ class PVAnnotator(QWidget):
 
         target = max(1, min(total, target))
         # Update display with clamped value
-        self.position_box.blockSignals(True)
-        self.position_box.setText(f"{target} of {total}")
-        self.position_box.blockSignals(False)
+        with QSignalBlocker(self.position_box):
+            self.position_box.setText(f"{target} of {total}")
 
-        target_path = visible[target - 1]
-        if target_path in self.media:
-            self.index = self.media.index(target_path)
-            self.show_item()
-            # If slideshow is active, restart timer for new item
-            if self.slideshow:
-                self.restart_slideshow_timer()
+        self.index = visible[target - 1]
+        self.show_item()
+        # If slideshow is active, restart timer for new item
+        if self.slideshow:
+            self.restart_slideshow_timer()
 
     def next_item(self):
-        self.index=(self.index+1)%len(self.media)
         # Skip over any files marked as skip=true ONLY when NOT in show_skipped_mode
-        if not self.show_skipped_mode:
-            start_index = self.index
-            while self.data.get(self.get_data_key(self.index), {}).get("skip", False):
-                self.index=(self.index+1)%len(self.media)
-                # Prevent infinite loop if all files are skipped
-                if self.index == start_index:
-                    break
+        # (get_visible_indices lists every index in show_skipped_mode)
+        visible = self.get_visible_indices()
+        if visible:
+            # First visible index after the current one, wrapping around
+            self.index = visible[bisect_right(visible, self.index) % len(visible)]
+        else:
+            # All files are skipped
+            self.index=(self.index+1)%len(self.media)
         self.show_item()
         # If slideshow is active, restart timer for new item
         if self.slideshow:
             self.restart_slideshow_timer()
 
     def prev_item(self):
-        self.index=(self.index-1)%len(self.media)
         # Skip over any files marked as skip=true ONLY when NOT in show_skipped_mode
-        if not self.show_skipped_mode:
-            start_index = self.index
-            while self.data.get(self.get_data_key(self.index), {}).get("skip", False):
-                self.index=(self.index-1)%len(self.media)
-                # Prevent infinite loop if all files are skipped
-                if self.index == start_index:
-                    break
+        visible = self.get_visible_indices()
+        if visible:
+            # Last visible index before the current one, wrapping around
+            self.index = visible[bisect_left(visible, self.index) - 1]
+        else:
+            # All files are skipped
+            self.index=(self.index-1)%len(self.media)
         if self.slideshow: self.toggle_slideshow()
         self.show_item()
 
@@ -2841,6 +3281,7 @@ class PVAnnotator(QWidget):
         entry = self.data.setdefault(data_key, {})
         current_skip = entry.get("skip", False)
         entry["skip"] = not current_skip  # Toggle skip state
+        self.visible_indices = None
         self.mark_data_changed()
         if not current_skip:  # If we just skipped it
             self.next_item()
@@ -2851,7 +3292,7 @@ class PVAnnotator(QWidget):
         p=self.current()
         data_key = self.get_data_key()
         # Only allow rotation for images
-        if p.suffix.lower() not in SUPPORTED_IMAGES:
+        if self.media_suffix[p] not in SUPPORTED_IMAGES:
             return
 
         entry=self.data.setdefault(data_key,{})
@@ -2906,6 +3347,8 @@ class PVAnnotator(QWidget):
             else:
                 new_mapping[idx + 1] = key  # Shift by one
         self.media_to_data_key = new_mapping
+        self.location_indices = None
+        self.visible_indices = None
 
         # Stay on the first version
         self.index = current_index
@@ -2916,7 +3359,7 @@ class PVAnnotator(QWidget):
         """Toggle crop mode on/off for images."""
         p=self.current()
         # Only allow cropping for images
-        if p.suffix.lower() not in SUPPORTED_IMAGES:
+        if self.media_suffix[p] not in SUPPORTED_IMAGES:
             return
 
         # Toggle crop mode
@@ -2999,16 +3442,14 @@ class PVAnnotator(QWidget):
         p=self.current()
         data_key = self.get_data_key()
         # Only allow volume control for videos
-        if p.suffix.lower() not in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] not in SUPPORTED_VIDEOS:
             return
 
         entry=self.data.setdefault(data_key,{})
         current_volume=entry.get("volume",100)
         # Cycle through 100, 80, 60, 40, 20, 0, then back to 100
-        volume_levels=[100,80,60,40,20,0]
-        current_idx=volume_levels.index(current_volume) if current_volume in volume_levels else 0
-        new_idx=(current_idx+1)%len(volume_levels)
-        new_volume=volume_levels[new_idx]
+        # Values off the cycle are treated as 100, so they continue to 80
+        new_volume = NEXT_VOLUME_LEVEL.get(current_volume, VOLUME_LEVELS[1])
 
         # Store volume only if not 100 (default)
         if new_volume==100:
@@ -3024,9 +3465,11 @@ class PVAnnotator(QWidget):
     def trash_item(self):
         p=self.current()
         # Stop video playback if it's a video file
-        if p.suffix.lower() in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] in SUPPORTED_VIDEOS:
             self.video_player.stop()
             self.video_player.setSource(QUrl())
+            # The path no longer holds this video
+            _video_duration_cache.pop(str(p), None)
 
         file_parent = p.parent
         trash_dir = file_parent / TRASH_DIR
@@ -3041,29 +3484,27 @@ class PVAnnotator(QWidget):
         if self.index < len(self.media):
             self.media.pop(self.index)
             # Also remove from mapping
-            if hasattr(self, 'media_to_data_key'):
-                self.media_to_data_key.pop(self.index, None)
-                # Shift indices down for all entries after current
-                new_mapping = {}
-                for idx, key in self.media_to_data_key.items():
-                    if idx > self.index:
-                        new_mapping[idx - 1] = key
-                    else:
-                        new_mapping[idx] = key
-                self.media_to_data_key = new_mapping
+            self.media_to_data_key.pop(self.index, None)
+            # Shift indices down for all entries after current
+            new_mapping = {}
+            for idx, key in self.media_to_data_key.items():
+                if idx > self.index:
+                    new_mapping[idx - 1] = key
+                else:
+                    new_mapping[idx] = key
+            self.media_to_data_key = new_mapping
+            self.location_indices = None
+            self.visible_indices = None
 
         self.index = min(self.index, len(self.media) - 1) if self.media else 0
         self.mark_data_changed()
 
         if self.media:
             # Skip over any files marked as skip=true ONLY when NOT in show_skipped_mode
-            if not self.show_skipped_mode:
-                start_index = self.index
-                while self.data.get(self.get_data_key(self.index), {}).get("skip", False):
-                    self.index=(self.index+1)%len(self.media)
-                    # Prevent infinite loop if all files are skipped
-                    if self.index == start_index:
-                        break
+            visible = self.get_visible_indices()
+            if visible:
+                # First visible index at or after the current one, wrapping around
+                self.index = visible[bisect_left(visible, self.index) % len(visible)]
             self.show_item()
 
     def get_effective_video_duration_ms(self, video_path):
@@ -3074,9 +3515,6 @@ class PVAnnotator(QWidget):
         if not annotations:
             return get_video_duration_ms(video_path)
 
-        # Sort annotations by time
-        annotations = sorted(annotations, key=lambda a: a["time"])
-
         # Find the last non-skipped segment
         last_non_skipped_time = 0.0
         for i, ann in enumerate(annotations):
@@ -3139,10 +3577,10 @@ class PVAnnotator(QWidget):
             self.timer.stop()
             self.text_scroll_timer.stop()
             # Restore original text (just in case it was modified during scrolling)
-            if hasattr(self, '_original_annotation_text'):
-                self.text_box.blockSignals(True)
-                self.text_box.setText(self._original_annotation_text)
-                self.text_box.blockSignals(False)
+            if self._original_annotation_text is not None:
+                with QSignalBlocker(self.text_box):
+                    self.text_box.setText(self._original_annotation_text)
+                self.shown_video_text = None
             # CRITICAL: Re-enable text box (was disabled during slideshow to prevent saving)
             self.text_box.setReadOnly(False)
             self.text_box.setFocus()  # Restore focus to ensure text box is fully interactive
@@ -3159,7 +3597,7 @@ class PVAnnotator(QWidget):
                 self.trash_btn.setStyleSheet("font-weight: bold;")
             # Re-enable Rotate and Duplicate buttons if appropriate
             p = self.current()
-            if p.suffix.lower() in SUPPORTED_IMAGES:
+            if self.media_suffix[p] in SUPPORTED_IMAGES:
                 self.rotate_btn.setEnabled(True)
                 if sys.platform.startswith('linux') or sys.platform == 'darwin':
                     self.rotate_btn.setStyleSheet("QPushButton { color: black; font-weight: bold; }")
@@ -3171,7 +3609,7 @@ class PVAnnotator(QWidget):
             else:
                 self.duplicate_btn.setStyleSheet("font-weight: bold;")
             # Pause video if currently playing one
-            if p.suffix.lower() in SUPPORTED_VIDEOS:
+            if self.media_suffix[p] in SUPPORTED_VIDEOS:
                 self.video_player.pause()
 
     def toggle_slideshow(self):
@@ -3197,67 +3635,13 @@ class PVAnnotator(QWidget):
             # No gray background - keep the normal appearance, just read-only
             self.text_box.setReadOnly(True)
             p=self.current()
-            image_time = self.get_image_time()
-            image_time_ms = int(image_time * 1000)
-            if p.suffix.lower() in SUPPORTED_VIDEOS:
+            if self.media_suffix[p] in SUPPORTED_VIDEOS:
                 # Start playing the video if not already playing
                 if self.video_player.playbackState() != QMediaPlayer.PlayingState:
                     self.video_player.play()
-                # For videos, get remaining duration from current position
-                # But if image_time <= 1 second, use image_time to allow fast navigation
-                if image_time <= 1:
-                    self.timer.start(image_time_ms)
-                else:
-                    remaining_ms = self.get_remaining_video_duration_ms(p)
-                    if remaining_ms and remaining_ms > 0:
-                        self.timer.start(remaining_ms)
-                    else:
-                        self.timer.start(image_time_ms)
-            else:
-                # For images, calculate delay based on text character count and line breaks
-                text = self.text_box.toPlainText()
-                text_lines = text.split('\n')
-                explicit_lines = len(text_lines)  # Number of line breaks + 1
-                char_count = len(text)
-
-                if char_count < 150 and explicit_lines <= 1:
-                    # Less than 150 characters and no line breaks: use delay time only
-                    self.timer.start(image_time_ms)
-                elif char_count <= 300 and explicit_lines <= 3:
-                    # Up to 300 characters and up to two line breaks: use max(delay, word_count_formula)
-                    if image_time > 1:
-                        duration=max(image_time,len(text.split())/4)*1000
-                        self.timer.start(int(duration))
-                    else:
-                        self.timer.start(image_time_ms)
-                else:
-                    # Beyond that: use scrolling over duration of max(delay_time, char_count/25)
-                    # But if image_time <= 1 second, use image_time without scrolling
-                    if image_time <= 1:
-                        self.timer.start(image_time_ms)
-                    else:
-                        display_lines = max(1, (char_count + 159) // 160)  # Round up using 160 chars per line
-                        num_lines = max(explicit_lines, display_lines)  # Use the larger value
-
-                        scroll_steps = max(num_lines - 3, 1)
-                        # Total time is max of configured delay or char_count / 25 seconds
-                        total_time = max(image_time, char_count / 25)
-                        total_duration_ms = int(total_time * 1000)
-
-                        # Distribute time: 1 second initial + scroll + 1 second final
-                        initial_pause = 1000
-                        final_pause = 1000
-                        scroll_duration = total_duration_ms - initial_pause - final_pause
-
-                        # Ensure at least some scroll duration
-                        if scroll_duration < 500:
-                            scroll_duration = 500
-                            initial_pause = max(100, (total_duration_ms - scroll_duration) // 2)
-                            final_pause = total_duration_ms - initial_pause - scroll_duration
-
-                        self._text_scroll_complete = False  # Reset flag for this item
-                        self.timer.start(total_duration_ms)
-                        self.start_text_scroll(initial_pause, scroll_duration, scroll_steps)
+            # Time this item the same way every slideshow advance does: remaining video
+            # duration, or a delay from the image's text length (scrolling long text)
+            self.restart_slideshow_timer()
         else:
             self.slide_btn.setText("Slideshow")
             # Reset button styling
@@ -3282,7 +3666,7 @@ class PVAnnotator(QWidget):
             # Re-enable Rotate and Duplicate buttons if appropriate
             self.timer.stop()
             p=self.current()
-            if p.suffix.lower() in SUPPORTED_IMAGES:
+            if self.media_suffix[p] in SUPPORTED_IMAGES:
                 self.rotate_btn.setEnabled(True)
                 if sys.platform.startswith('linux') or sys.platform == 'darwin':
                     self.rotate_btn.setStyleSheet("QPushButton { color: black; font-weight: bold; }")
@@ -3300,7 +3684,7 @@ class PVAnnotator(QWidget):
             else:
                 self.crop_btn.setStyleSheet("font-weight: bold;")
             # Pause video if currently playing one
-            if p.suffix.lower() in SUPPORTED_VIDEOS:
+            if self.media_suffix[p] in SUPPORTED_VIDEOS:
                 self.video_player.pause()
 
     def toggle_show_skipped(self):
@@ -3320,16 +3704,11 @@ class PVAnnotator(QWidget):
                 self.show_skipped_btn.setStyleSheet("font-weight: bold;")
             self.search_box.setPlaceholderText("Search")
             # If current file is skipped, advance to next unskipped file
-            p = self.current()
-            if self.data.get(p.name, {}).get("skip", False):
-                start_index = self.index
-                while True:
-                    self.index = (self.index + 1) % len(self.media)
-                    if not self.data.get(self.media[self.index].name, {}).get("skip", False):
-                        break
-                    # Prevent infinite loop if all files are skipped
-                    if self.index == start_index:
-                        break
+            visible = self.get_visible_indices()
+            if visible:
+                i = bisect_left(visible, self.index)
+                if i == len(visible) or visible[i] != self.index:
+                    self.index = visible[i % len(visible)]
             self.show_item()  # Refresh to update skip button styling
 
     def advance_slideshow(self):
@@ -3403,17 +3782,12 @@ class PVAnnotator(QWidget):
             return
 
         # Use the original saved text (never modified)
-        if not hasattr(self, '_original_annotation_text'):
-            return
-
         text = self._original_annotation_text
-
         if not text:
             return
 
-        # Split text by newlines to get explicit lines
-        lines = text.split('\n')
-        explicit_lines = len(lines)
+        # Count explicit lines (only the count is needed, so the text is not split)
+        explicit_lines = text.count('\n') + 1
         char_count = len(text)
 
         # Calculate display lines needed (160 chars per line at current font size)
@@ -3430,6 +3804,8 @@ class PVAnnotator(QWidget):
             scroll_interval = max(900, scroll_duration_ms // scroll_steps) if scroll_steps > 0 else 900
             self.text_scroll_interval = scroll_interval
             self.text_scroll_steps = scroll_steps
+            # Font cannot change mid-slideshow, so each tick only multiplies by this
+            self.text_scroll_line_height = self.text_box.fontMetrics().lineSpacing()
 
             # Start with initial pause before scrolling begins
             QTimer.singleShot(initial_pause_ms, self._start_scrolling_after_delay)
@@ -3437,40 +3813,23 @@ class PVAnnotator(QWidget):
     def scroll_annotation_text(self):
         """Scroll through text during slideshow by scrolling the viewport.
         The original text is never modified - we just scroll the view vertically."""
-        if not self.slideshow or not hasattr(self, 'text_scroll_line_index'):
+        if not self.slideshow or self.text_scroll_line_index is None:
             self.text_scroll_timer.stop()
             return
 
-        # Get the text (original, unmodified)
-        text = self._original_annotation_text
-        if not text:
+        # Line count and line height were measured once in start_text_scroll
+        if not self._original_annotation_text or self.text_scroll_line_height is None:
             self.text_scroll_timer.stop()
             return
 
-        # Calculate display metrics
-        lines = text.split('\n')
-        explicit_lines = len(lines)
-        char_count = len(text)
-        display_lines = max(1, (char_count + 159) // 160)
-        num_lines = max(explicit_lines, display_lines)
-
         # Advance to next line if not at end
-        if self.text_scroll_line_index < num_lines - 3:
+        if self.text_scroll_line_index < self.text_scroll_total_lines - 3:
             self.text_scroll_line_index += 1
 
-            # Use vertical scrollbar to scroll the view
-            scrollbar = self.text_box.verticalScrollBar()
-
-            # Estimate scroll position based on which "line" we're viewing
-            # Each "line" in scrollbar units should advance based on font height
-            # Get font metrics to know line height
-            fm = self.text_box.fontMetrics()
-            line_height = fm.lineSpacing()
-
             # Scroll position = current line index * line height
             # But we want to show lines starting from this index
-            scroll_amount = self.text_scroll_line_index * line_height
-            scrollbar.setValue(scroll_amount)
+            scroll_amount = self.text_scroll_line_index * self.text_scroll_line_height
+            self.text_box.verticalScrollBar().setValue(scroll_amount)
         else:
             # Last line reached, stop scrolling (final pause is handled by main timer)
             self.text_scroll_timer.stop()
@@ -3483,7 +3842,7 @@ class PVAnnotator(QWidget):
 
     def _start_scrolling_after_delay(self):
         """Helper to start scrolling after the 1-second pause."""
-        if self.slideshow and hasattr(self, 'text_scroll_interval'):
+        if self.slideshow and self.text_scroll_interval is not None:
             self.text_scroll_timer.start(self.text_scroll_interval)
         else:
             self.text_scroll_timer.stop()
@@ -3501,7 +3860,7 @@ class PVAnnotator(QWidget):
         """Completely reset video and replay from start."""
         self.stop_slideshow_if_running()
         p = self.current()
-        if p.suffix.lower() in SUPPORTED_VIDEOS:
+        if self.media_suffix[p] in SUPPORTED_VIDEOS:
             # Full reset: stop, clear source completely, then reload to clear decoder state
             self.video_player.stop()
             self.video_player.setSource(QUrl())  # Clear source first
@@ -3514,10 +3873,17 @@ class PVAnnotator(QWidget):
 
     # ---------------- Keyboard ----------------
     def keyPressEvent(self,event):
-        if event.key()==Qt.Key_Right: self.next_item()
-        elif event.key()==Qt.Key_Left: self.prev_item()
+        handler=self.key_handlers.get(event.key())
+        if handler: handler()
         else: super().keyPressEvent(event)
 
+    def closeEvent(self, event):
+        # Write typing and changes still waiting on their timers before the window goes away
+        if self.dir is not None:
+            self.update_active_annotation_text()
+            self.save()
+        super().closeEvent(event)
+
 if __name__=="__main__":
     # Suppress FFmpeg's stderr output (AAC codec warnings, etc.)
     devnull = open(os.devnull, 'w')
@@ -3533,4 +3899,16 @@ if __name__=="__main__":
     start_path=sys.argv[1] if len(sys.argv)>1 else None
     w=PVAnnotator(start_path)
     w.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # Drop queued duration probes so exit does not wait on them
+    # (cancelled one by one: shutdown's cancel_futures needs Python 3.9)
+    for future in list(w.duration_probe_pending.values()):
+        future.cancel()
+    w.duration_probe_pool.shutdown(wait=False)
+    # Same for images still waiting to be decoded
+    for future in list(w.image_pending.values()):
+        future.cancel()
+    w.image_pool.shutdown(wait=False)
+    # Let queued saves reach the disk before exiting
+    w.save_pool.shutdown(wait=True)
+    sys.exit(exit_code)